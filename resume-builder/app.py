@@ -1,38 +1,115 @@
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, session
+from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, session, Response, stream_with_context
+import hashlib
 import json
+import multiprocessing
 import os
+import uuid
+from io import BytesIO
 from datetime import datetime
-from resume_generator import ResumeGenerator
+from resume_generator import ResumeGenerator, MIME_TYPES
+from format_backends import get_backend, loaded_backends
+from memory_store import MemoryResumeStore
+from render_queue import RenderQueue, QueueFull, FINISHED
+from zip_export import stream_zip
+from resume_layout import build_layout
+from preview_renderer import PREVIEW_FORMATS, render_preview, preview_hash
+from job_feed import RemotiveClient, JobFeedCache
+from job_store import JobStore
+from job_ingester import JobFeedIngester
+from job_index import profile_terms
 from linkedin_api_client import LinkedInProfileParser, LinkedInAPIClient
 from github_api_client import GitHubProfileParser, GitHubAPIClient
 from config import Config
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 app = Flask(__name__)
 app.config.from_object(Config)
 
-# Debug print for GitHub API config
-print('GITHUB_CLIENT_ID:', Config.GITHUB_CLIENT_ID)
-print('GITHUB_CLIENT_SECRET:', Config.GITHUB_CLIENT_SECRET)
-print('GITHUB_REDIRECT_URI:', Config.GITHUB_REDIRECT_URI)
-
-# Initialize LinkedIn API client
-linkedin_client = None
-if Config.is_linkedin_configured():
-    linkedin_client = LinkedInAPIClient(
-        Config.LINKEDIN_CLIENT_ID, 
-        Config.LINKEDIN_CLIENT_SECRET, 
-        Config.LINKEDIN_REDIRECT_URI
+# Batch render workers are spawned processes that import the main script again
+# (and so this module). They only need _init_batch_worker's generator, so the
+# clients, stores and background threads below are built in the app process alone.
+app_process = multiprocessing.current_process().name == 'MainProcess'
+
+if app_process:
+    # Debug print for GitHub API config
+    print('GITHUB_CLIENT_ID:', Config.GITHUB_CLIENT_ID)
+    print('GITHUB_CLIENT_SECRET:', Config.GITHUB_CLIENT_SECRET)
+    print('GITHUB_REDIRECT_URI:', Config.GITHUB_REDIRECT_URI)
+
+    # Initialize LinkedIn API client
+    linkedin_client = None
+    if Config.is_linkedin_configured():
+        linkedin_client = LinkedInAPIClient(
+            Config.LINKEDIN_CLIENT_ID, 
+            Config.LINKEDIN_CLIENT_SECRET, 
+            Config.LINKEDIN_REDIRECT_URI
+        )
+
+    # Initialize GitHub API client
+    github_client = None
+    if Config.is_github_configured():
+        github_client = GitHubAPIClient(
+            Config.GITHUB_CLIENT_ID, 
+            Config.GITHUB_CLIENT_SECRET, 
+            Config.GITHUB_REDIRECT_URI
+        )
+
+    # Initialize resume generator; format backends load on first use unless preloaded
+    resume_generator = ResumeGenerator()
+    if Config.PRELOAD_FORMATS:
+        resume_generator.warm_up(Config.PRELOAD_FORMATS)
+    resume_generator.storage_manager.start()
+
+    # Background render jobs for clients that poll or listen for events instead of waiting
+    render_queue = RenderQueue(
+        resume_generator,
+        Config.RENDER_QUEUE_WORKERS,
+        Config.RENDER_QUEUE_MAX_DEPTH,
+        Config.RENDER_JOB_TTL
+    )
+    render_queue.start()
+
+    # Rendered resumes that are served from memory instead of generated_resumes/
+    memory_store = MemoryResumeStore(
+        Config.MEMORY_STORE_MAX_ITEMS,
+        Config.MEMORY_STORE_MAX_BYTES,
+        Config.MEMORY_STORE_TTL
     )
 
-# Initialize GitHub API client
-github_client = None
-if Config.is_github_configured():
-    github_client = GitHubAPIClient(
-        Config.GITHUB_CLIENT_ID, 
-        Config.GITHUB_CLIENT_SECRET, 
-        Config.GITHUB_REDIRECT_URI
+    # Job searches are served from a local cache that refreshes in the background
+    job_client = RemotiveClient(Config.JOB_FEED_URL, Config.JOB_FEED_TIMEOUT)
+    job_feed = JobFeedCache(
+        job_client.search,
+        Config.JOB_FEED_TTL,
+        Config.JOB_FEED_STALE_TTL,
+        Config.JOB_FEED_MAX_QUERIES
     )
 
+    # With ingest enabled, the whole feed is mirrored into a local store instead and
+    # the job endpoints search that once it holds a feed. One process writes the
+    # store; the others refresh their index from it.
+    if Config.JOB_FEED_INGEST_INTERVAL > 0:
+        job_store = JobStore(Config.JOB_STORE_PATH, Config.JOB_STORE_TOMBSTONE_TTL)
+        job_ingester = JobFeedIngester(
+            job_client.search,
+            job_store,
+            Config.JOB_FEED_INGEST_INTERVAL,
+            Config.JOB_FEED_INGEST_RETRY,
+            Config.JOB_STORE_REFRESH_INTERVAL
+        )
+        job_ingester.start()
+    else:
+        job_store = None
+        job_ingester = None
+else:
+    linkedin_client = github_client = None
+    resume_generator = render_queue = memory_store = None
+    job_client = job_feed = job_store = job_ingester = None
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -206,6 +283,47 @@ def upload_github():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def job_store_ready():
+    """Whether the job endpoints can search the local store. Until its first
+    ingest (a cold start, or a failed first pull) they use the job feed cache."""
+    return job_store is not None and job_store.ready
+
+def get_owner_id():
+    """Anonymous per-browser id that generated files are charged to for quotas"""
+    if 'owner_id' not in session:
+        session['owner_id'] = uuid.uuid4().hex
+    return session['owner_id']
+
+def owner_scope(owner):
+    """Resolve an owner=me|all parameter to (owner to filter by, None) or, if
+    it is invalid or not allowed, (None, error response). owner=all (no
+    filter) needs LIST_RESUMES_ALLOW_ALL."""
+    if owner not in ('me', 'all'):
+        return None, (jsonify({'error': 'owner must be me or all'}), 400)
+    if owner == 'all' and not Config.LIST_RESUMES_ALLOW_ALL:
+        return None, (jsonify({'error': 'Listing all resumes is disabled'}), 403)
+    return (get_owner_id() if owner == 'me' else None), None
+
+def flatten_profile(profile_data):
+    """Convert LinkedIn-style profiles (with personal_info) to the flat format"""
+    if isinstance(profile_data, dict):
+        if 'personal_info' in profile_data:
+            linkedin_format = {
+                'name': profile_data['personal_info'].get('name', ''),
+                'headline': profile_data['personal_info'].get('headline', ''),
+                'location': profile_data['personal_info'].get('location', ''),
+                'email': profile_data['personal_info'].get('email', ''),
+                'phone': profile_data['personal_info'].get('phone', ''),
+                'summary': profile_data['personal_info'].get('summary', ''),
+                'experience': profile_data.get('experience', []),
+                'education': profile_data.get('education', []),
+                'skills': profile_data.get('skills', []),
+                'certifications': profile_data.get('certifications', []),
+                'achievements': profile_data.get('achievements', [])
+            }
+            profile_data = linkedin_format
+    return profile_data
+
 @app.route('/generate-resume', methods=['POST'])
 def generate_resume():
     try:
@@ -213,126 +331,393 @@ def generate_resume():
         profile_data = data.get('profile_data')
         template = data.get('template', 'modern')
         format = data.get('format', 'docx')
+        # 'file' writes to generated_resumes/, 'memory' keeps the render in the
+        # in-memory store, 'inline' streams it back in this response
+        delivery = data.get('delivery', 'file')
+        # 'fast' writes the modern template's OOXML directly instead of via python-docx
+        docx_writer = data.get('docx_writer', 'python-docx')
+        # Shrink a PDF just enough to fit this many pages
+        fit_pages = data.get('fit_pages')
         if not profile_data:
             return jsonify({'error': 'Profile data is required'}), 400
-        if isinstance(profile_data, dict):
-            if 'personal_info' in profile_data:
-                linkedin_format = {
-                    'name': profile_data['personal_info'].get('name', ''),
-                    'headline': profile_data['personal_info'].get('headline', ''),
-                    'location': profile_data['personal_info'].get('location', ''),
-                    'email': profile_data['personal_info'].get('email', ''),
-                    'phone': profile_data['personal_info'].get('phone', ''),
-                    'summary': profile_data['personal_info'].get('summary', ''),
-                    'experience': profile_data.get('experience', []),
-                    'education': profile_data.get('education', []),
-                    'skills': profile_data.get('skills', []),
-                    'certifications': profile_data.get('certifications', []),
-                    'achievements': profile_data.get('achievements', [])
-                }
-                profile_data = linkedin_format
-        generator = ResumeGenerator()
-        filename = generator.generate_resume(profile_data, template, format)
+        if fit_pages is not None and (type(fit_pages) is not int or fit_pages < 1):
+            return jsonify({'error': 'fit_pages must be a positive integer'}), 400
+        profile_data = flatten_profile(profile_data)
+        # A list of formats (or "both") renders them all from one layout
+        formats = data.get('formats') or (['docx', 'pdf'] if format == 'both' else None)
+        if data.get('async'):
+            # Queue the render and answer at once; follow it via /render-jobs/<job_id>
+            if delivery != 'file':
+                return jsonify({'error': 'Asynchronous renders require file delivery'}), 400
+            try:
+                job = render_queue.submit(
+                    profile_data, template, formats or [format], docx_writer,
+                    get_owner_id(), data.get('priority', 'normal'), fit_pages
+                )
+            except QueueFull as e:
+                response = jsonify({'error': str(e), 'queue_depth': render_queue.stats()['queued']})
+                response.headers['Retry-After'] = '5'
+                return response, 503
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            return jsonify(dict(
+                job,
+                success=True,
+                status_url=url_for('render_job_status', job_id=job['job_id']),
+                events_url=url_for('render_job_events', job_id=job['job_id'])
+            )), 202
+        if formats:
+            if delivery != 'file':
+                return jsonify({'error': 'Multiple formats require file delivery'}), 400
+            filenames = resume_generator.generate_resumes(profile_data, template, formats, docx_writer, get_owner_id(), fit_pages)
+            result = {
+                'success': True,
+                'filename': filenames[formats[0]],
+                'filenames': filenames
+            }
+            if fit_pages and 'pdf' in filenames:
+                result['fit'] = resume_generator.fit_report(fit_pages, filenames['pdf'])
+            return jsonify(result)
+        # A PDF that does not fit fit_pages even at the smallest scale is still
+        # delivered; the fit report says how many pages it took
+        fitted = fit_pages and format == 'pdf'
+        if delivery == 'inline':
+            filename, buffer = resume_generator.render_resume(profile_data, template, format, docx_writer, fit_pages)
+            response = send_file(buffer, mimetype=MIME_TYPES[format], as_attachment=True, download_name=filename)
+            if fitted:
+                fit = resume_generator.fit_report(fit_pages, data=buffer.getvalue())
+                response.headers['X-Resume-Pages'] = str(fit['pages'])
+                response.headers['X-Fit-Exceeded'] = 'true' if fit['fit_exceeded'] else 'false'
+            return response
+        if delivery == 'memory':
+            filename, buffer = resume_generator.render_resume(profile_data, template, format, docx_writer, fit_pages)
+            result = {
+                'success': True,
+                'filename': memory_store.put(filename, buffer.getvalue(), MIME_TYPES[format])
+            }
+            if fitted:
+                result['fit'] = resume_generator.fit_report(fit_pages, data=buffer.getvalue())
+            return jsonify(result)
+        filename = resume_generator.generate_resume(profile_data, template, format, docx_writer, get_owner_id(), fit_pages=fit_pages)
         if not filename:
             return jsonify({'error': 'Failed to generate resume'}), 500
-        return jsonify({
+        result = {
             'success': True,
             'filename': filename
+        }
+        if fitted:
+            result['fit'] = resume_generator.fit_report(fit_pages, filename)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/preview-resume', methods=['POST'])
+def preview_resume():
+    """Live preview as HTML or text from the same layout the downloads use.
+    Send back the last hash to get {'unchanged': true} instead of the content."""
+    try:
+        data = request.get_json()
+        profile_data = data.get('profile_data')
+        format = data.get('format', 'html')
+        if not profile_data:
+            return jsonify({'error': 'Profile data is required'}), 400
+        if format not in PREVIEW_FORMATS:
+            return jsonify({'error': f'Unsupported preview format: {format}'}), 400
+        content = render_preview(build_layout(flatten_profile(profile_data)), format)
+        content_hash = preview_hash(content)
+        if content_hash == data.get('hash'):
+            return jsonify({'success': True, 'hash': content_hash, 'unchanged': True})
+        return jsonify({
+            'success': True,
+            'hash': content_hash,
+            'format': format,
+            'content': content
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/render-jobs/<job_id>')
+def render_job_status(job_id):
+    """Status of a queued render: queued, running, done (with filenames) or failed"""
+    job = render_queue.status(job_id, get_owner_id())
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/render-jobs/<job_id>/events')
+def render_job_events(job_id):
+    """Server-Sent Events stream with one event per status change, ending when the job finishes"""
+    owner_id = get_owner_id()
+    if render_queue.status(job_id, owner_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    def events():
+        version = None
+        while True:
+            job = render_queue.wait(job_id, version, owner_id)
+            if job is None:
+                return
+            if job['version'] == version:
+                # Comment line that keeps proxies from closing an idle stream
+                yield ': keep-alive\n\n'
+                continue
+            version = job['version']
+            yield f"id: {version}\nevent: {job['status']}\ndata: {json.dumps(job)}\n\n"
+            if job['status'] in FINISHED:
+                return
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/generate-resumes-batch', methods=['POST'])
+def generate_resumes_batch():
+    try:
+        data = request.get_json()
+        profiles = data.get('profiles')
+        templates = data.get('templates') or [data.get('template', 'modern')]
+        formats = data.get('formats') or [data.get('format', 'docx')]
+        if not profiles or not isinstance(profiles, list):
+            return jsonify({'error': 'A list of profiles is required'}), 400
+        total = len(profiles) * len(templates) * len(formats)
+        if total > Config.BATCH_MAX_ITEMS:
+            return jsonify({'error': f'Batch of {total} resumes exceeds the limit of {Config.BATCH_MAX_ITEMS}'}), 400
+        profiles = [flatten_profile(profile_data) for profile_data in profiles]
+        summary = resume_generator.generate_batch(profiles, templates, formats, get_owner_id())
+        return jsonify(dict(summary, success=True))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/download-resume/<filename>')
 def download_resume(filename):
     try:
-        file_path = os.path.join('generated_resumes', filename)
-        if os.path.exists(file_path):
-            return send_file(file_path, as_attachment=True)
+        # send_file answers If-None-Match/If-Modified-Since with 304 and Range with 206
+        stored = memory_store.get(filename)
+        if stored:
+            data, mimetype = stored
+            response = send_file(
+                BytesIO(data), mimetype=mimetype, as_attachment=True, download_name=filename,
+                etag=hashlib.sha256(data).hexdigest(), max_age=memory_store.ttl
+            )
+            # Personal and short-lived, so kept out of shared caches
+            response.cache_control.public = False
+            response.cache_control.private = True
+            return response
+        storage = resume_generator.storage
+        file_path = storage.resolve(filename)
+        if file_path:
+            resume_generator.storage_manager.touch(filename)
+            if not storage.content_hash(filename):
+                return send_file(file_path, as_attachment=True)
+            # Content-addressed files hold the same resume for good, so browsers and
+            # CDNs may keep them. A re-render is not byte-identical though, so the
+            # strong ETag (also used for If-Range) is the hash of the bytes on disk.
+            response = send_file(
+                file_path, as_attachment=True,
+                etag=resume_generator.file_digest(filename), max_age=Config.DOWNLOAD_MAX_AGE
+            )
+            response.cache_control.immutable = True
+            return response
         else:
             return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/export-resumes', methods=['GET', 'POST'])
+def export_resumes():
+    """Stream a ZIP of selected resumes, or of all of this browser's resumes
+    matching template/format (every session's with owner=all, if allowed)"""
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            data = {}
+        filenames = data.get('filenames') or request.args.getlist('filename')
+        template = data.get('template') or request.args.get('template')
+        format = data.get('format') or request.args.get('format')
+        if not isinstance(filenames, list) or not all(isinstance(name, str) for name in filenames):
+            return jsonify({'error': 'filenames must be a list of strings'}), 400
+        if len(filenames) > Config.EXPORT_MAX_FILES:
+            return jsonify({'error': f'Export of {len(filenames)} files exceeds the limit of {Config.EXPORT_MAX_FILES}'}), 400
+        storage = resume_generator.storage
+        if filenames:
+            if any(name != os.path.basename(name) for name in filenames):
+                return jsonify({'error': 'Invalid filename'}), 400
+            missing = [name for name in filenames if not storage.resolve(name)]
+            if missing:
+                return jsonify({'error': 'File not found', 'missing': missing}), 404
+        else:
+            owner, error = owner_scope(data.get('owner') or request.args.get('owner', 'me'))
+            if error:
+                return error
+            rows, more = resume_generator.index.list(Config.EXPORT_MAX_FILES, owner=owner, template=template, format=format)
+            if more:
+                return jsonify({'error': f'Export exceeds the limit of {Config.EXPORT_MAX_FILES} files'}), 400
+            filenames = [row['filename'] for row in rows if storage.resolve(row['filename'])]
+        if not filenames:
+            return jsonify({'error': 'No resumes to export'}), 404
+        archive_name = f"resumes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        return Response(
+            stream_with_context(stream_zip((name, storage.path_for(name)) for name in filenames)),
+            mimetype='application/zip',
+            headers={'Content-Disposition': f'attachment; filename={archive_name}'}
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/list-resumes')
+def list_resumes():
+    """Page through this browser's generated resumes, newest first. Pass
+    next_cursor back as cursor for the following page. owner=all lists every
+    session's files, if LIST_RESUMES_ALLOW_ALL is set."""
+    try:
+        limit = min(request.args.get('limit', Config.LIST_RESUMES_PAGE_SIZE, type=int), Config.LIST_RESUMES_MAX_PAGE_SIZE)
+        cursor = request.args.get('cursor')
+        if limit < 1 or (cursor is not None and not cursor.isdigit()):
+            return jsonify({'error': 'Invalid limit or cursor'}), 400
+        owner, error = owner_scope(request.args.get('owner', 'me'))
+        if error:
+            return error
+        owner_id = get_owner_id()
+        rows, next_cursor = resume_generator.index.list(
+            limit,
+            cursor,
+            owner=owner,
+            template=request.args.get('template'),
+            format=request.args.get('format'),
+            created_after=request.args.get('since', type=float),
+            created_before=request.args.get('until', type=float),
+            viewer=owner_id
+        )
+        return jsonify({
+            'files': [row['filename'] for row in rows],
+            'items': [{
+                'filename': row['filename'],
+                'template': row['template'],
+                'format': row['format'],
+                'size': row['size'],
+                'created': row['created'],
+                'content_hash': row['content_hash'],
+                'mine': bool(row['mine'])
+            } for row in rows],
+            'next_cursor': next_cursor
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/runtime-stats')
+def runtime_stats():
+    """Per-worker memory, format backend load times and fragment cache hit rates"""
+    return jsonify({
+        'pid': os.getpid(),
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        'backends': loaded_backends(),
+        'fragment_caches': {
+            format: get_backend(format).fragment_cache.stats()
+            for format in loaded_backends()
+            if hasattr(get_backend(format), 'fragment_cache')
+        },
+        'storage': resume_generator.storage_manager.stats(),
+        'render_queue': render_queue.stats(),
+        'job_feed': job_feed.stats(),
+        'job_store': job_ingester.stats() if job_ingester is not None else None
+    })
+
 @app.route('/suggest-jobs', methods=['POST'])
 def suggest_jobs():
     try:
         data = request.get_json()
         profile_data = data.get('profile_data', {})
-        keywords = []
-        # Use job title from most recent experience if available
-        experience = profile_data.get('experience', [])
-        if experience and isinstance(experience, list):
-            job_title = experience[0].get('title', '')
-            if job_title:
-                keywords.append(job_title)
-        # Add skills
-        skills = profile_data.get('skills', [])
-        if skills and isinstance(skills, list):
-            keywords.extend(skills[:3])
-        # Fallback to headline
-        headline = profile_data.get('headline', '')
-        if headline:
-            keywords.append(headline)
-        query = ' '.join(keywords) or 'developer'
-        api_url = f'https://remotive.com/api/remote-jobs?search={query}'
-        import requests
-        resp = requests.get(api_url)
+        # Rank the whole cached feed against every skill, experience title, the
+        # headline and the summary, instead of one upstream keyword search
+        terms = profile_terms(profile_data) or {'developer': 1.0}
+        feed = job_store.index if job_store_ready() else job_feed.get('')
         jobs = []
-        if resp.status_code == 200:
-            results = resp.json().get('jobs', [])
-            for job in results[:10]:
-                jobs.append({
-                    'title': job.get('title'),
-                    'company': job.get('company_name'),
-                    'location': job.get('candidate_required_location'),
-                    'url': job.get('url'),
-                    'description': job.get('description', '')[:200] + '...'
-                })
+        for job, score in feed.rank(terms, 10):
+            jobs.append({
+                'title': job.get('title'),
+                'company': job.get('company_name'),
+                'location': job.get('candidate_required_location'),
+                'url': job.get('url'),
+                'description': (job.get('description') or '')[:200] + '...',
+                'score': round(score, 3)
+            })
         return jsonify({'jobs': jobs})
     except Exception as e:
         return jsonify({'jobs': [], 'error': str(e)})
 
+def job_summary(job):
+    return {
+        'title': job.get('title'),
+        'company': job.get('company_name'),
+        'location': job.get('candidate_required_location'),
+        'type': job.get('job_type'),
+        'description': (job.get('description') or '')[:200] + '...',
+        'url': job.get('url'),
+        'logo': job.get('company_logo_url'),
+        'salary': job.get('salary'),
+        'category': job.get('category')
+    }
+
 @app.route('/job-search', methods=['POST'])
 def job_search():
+    """Page through matching jobs, newest first. Pass next_cursor back as cursor
+    for the following page. With stream set (or Accept: application/x-ndjson)
+    the matches are streamed as NDJSON instead, one job per line as they are
+    found, up to limit if given, then a final {"next_cursor": ...} line."""
     try:
         data = request.get_json()
         skills = data.get('skills', '').lower()
         experience = data.get('experience', '')
         location = data.get('location', '').lower()
         job_type = data.get('jobType', '').lower()
-        import requests
-        # Build Remotive API query
-        query = skills or ''
-        remotive_url = f'https://remotive.com/api/remote-jobs?search={query}'
-        resp = requests.get(remotive_url)
-        jobs = []
-        if resp.status_code == 200:
-            all_jobs = resp.json().get('jobs', [])
-            for job in all_jobs:
-                # Filter by location if provided
-                if location and location not in job.get('candidate_required_location', '').lower():
-                    continue
-                # Filter by job type (Remotive uses 'job_type' field: 'full_time', 'part_time', 'contract', etc.)
-                if job_type:
-                    jt = job.get('job_type', '').lower()
-                    if job_type == 'remote' and 'remote' not in jt:
-                        continue
-                    if job_type == 'onsite' and 'remote' in jt:
-                        continue
-                    if job_type == 'hybrid' and 'hybrid' not in jt:
-                        continue
-                jobs.append({
-                    'title': job.get('title'),
-                    'company': job.get('company_name'),
-                    'location': job.get('candidate_required_location'),
-                    'type': job.get('job_type'),
-                    'description': job.get('description', '')[:200] + '...',
-                    'url': job.get('url'),
-                    'logo': job.get('company_logo_url'),
-                    'salary': job.get('salary'),
-                    'category': job.get('category')
-                })
-        return jsonify({'jobs': jobs[:18]})
+        cursor = data.get('cursor')
+        cursor = None if cursor in (None, '') else str(cursor)
+        stream = data.get('stream') or 'application/x-ndjson' in request.headers.get('Accept', '')
+        limit = data.get('limit')
+        if limit is None and not stream:
+            limit = Config.JOB_SEARCH_PAGE_SIZE
+        if (limit is not None and (not isinstance(limit, int) or limit < 1)) or (cursor is not None and not cursor.isdigit()):
+            return jsonify({'jobs': [], 'error': 'Invalid limit or cursor'}), 400
+
+        # Answered from the local job store, or else as a Remotive search query
+        # through the job feed cache. The location and job type filters are
+        # posting-list intersections on their index.
+        if job_store_ready():
+            index = job_store.index
+            terms = [skills]
+        else:
+            index = job_feed.get(skills or '')
+            terms = []
+
+        if not stream:
+            jobs, next_cursor = index.page(
+                min(limit, Config.JOB_SEARCH_MAX_PAGE_SIZE), cursor, terms=terms, location=location, job_type=job_type
+            )
+            return jsonify({'jobs': [job_summary(job) for job in jobs], 'next_cursor': next_cursor})
+
+        def lines(cursor, remaining):
+            # One page at a time, so the first jobs go out before later ones are
+            # looked for and the index is never locked while the client reads
+            while True:
+                size = Config.JOB_SEARCH_PAGE_SIZE if remaining is None else min(remaining, Config.JOB_SEARCH_PAGE_SIZE)
+                jobs, cursor = index.page(size, cursor, terms=terms, location=location, job_type=job_type)
+                for job in jobs:
+                    yield json.dumps(job_summary(job)) + '\n'
+                if remaining is not None:
+                    remaining -= len(jobs)
+                if cursor is None or remaining == 0:
+                    yield json.dumps({'next_cursor': cursor}) + '\n'
+                    return
+
+        return Response(
+            stream_with_context(lines(cursor, limit)),
+            mimetype='application/x-ndjson',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
     except Exception as e:
         return jsonify({'jobs': [], 'error': str(e)})
 
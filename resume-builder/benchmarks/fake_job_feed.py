@@ -0,0 +1,115 @@
+"""
+Local stand-in for the Remotive remote-jobs API.
+
+Serves GET /api/remote-jobs?search=<words> from a fixed set of synthetic
+postings, after an artificial delay, so /job-search and /suggest-jobs can be
+exercised and benchmarked without network access. Point the app at it with
+JOB_FEED_URL=http://127.0.0.1:<port>/api/remote-jobs.
+
+Usage: python benchmarks/fake_job_feed.py [--port 8090] [--jobs 2000] [--latency-ms 300]
+
+Other scripts can run it in-process with start_fake_feed().
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+TITLES = (
+    'Senior Python Engineer', 'Frontend Developer', 'Data Scientist', 'DevOps Engineer',
+    'Product Designer', 'Backend Engineer', 'Machine Learning Engineer', 'Support Specialist',
+    'Full Stack Developer', 'Engineering Manager', 'QA Engineer', 'Technical Writer'
+)
+SKILLS = (
+    'python django flask react typescript javascript node aws gcp docker kubernetes '
+    'postgresql redis kafka spark pandas pytorch terraform go rust java figma graphql'
+).split()
+LOCATIONS = ('Worldwide', 'USA Only', 'Europe', 'UK', 'Canada', 'Americas', 'Germany')
+JOB_TYPES = ('full_time', 'contract', 'part_time', 'freelance')
+CATEGORIES = ('Software Development', 'Data', 'DevOps / Sysadmin', 'Design', 'Customer Service')
+
+def synthetic_jobs(count, seed=0):
+    """Postings shaped like Remotive's, with long HTML descriptions"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        skills = rng.sample(SKILLS, 5)
+        paragraphs = ''.join(
+            f"<p>You will work with {', '.join(rng.sample(SKILLS, 4))} on a distributed team.</p>"
+            for _ in range(8)
+        )
+        jobs.append({
+            'id': 100000 + i,
+            'url': f'https://remotive.example/remote-jobs/{100000 + i}',
+            'title': f'{rng.choice(TITLES)} ({skills[0].title()})',
+            'company_name': f'Company {i % 300}',
+            'company_logo_url': f'https://remotive.example/logo/{i % 300}.png',
+            'category': rng.choice(CATEGORIES),
+            'tags': skills,
+            'job_type': rng.choice(JOB_TYPES),
+            'publication_date': f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00',
+            'candidate_required_location': rng.choice(LOCATIONS),
+            'salary': rng.choice(('', '$80k - $120k', '$120k - $160k', '€60k - €90k')),
+            'description': f"<p>Skills: {' '.join(skills)}.</p>{paragraphs}"
+        })
+    return jobs
+
+def matches(job, words):
+    text = ' '.join((job['title'], job['company_name'], job['category'], ' '.join(job['tags']))).lower()
+    return all(word in text for word in words)
+
+def make_handler(jobs, latency):
+    class FakeFeedHandler(BaseHTTPRequestHandler):
+        requests_served = 0
+        # Replace or edit to change what the feed serves
+        postings = jobs
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != '/api/remote-jobs':
+                self.send_error(404)
+                return
+            time.sleep(latency)
+            words = ' '.join(parse_qs(url.query).get('search', [''])).lower().split()
+            results = [job for job in FakeFeedHandler.postings if matches(job, words)]
+            body = json.dumps({'job-count': len(results), 'jobs': results}).encode('utf-8')
+            FakeFeedHandler.requests_served += 1
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeFeedHandler
+
+def start_fake_feed(port=0, jobs=2000, latency_ms=300):
+    """Serve the fake feed from a daemon thread; returns (server, feed url).
+    Port 0 picks a free port. server.RequestHandlerClass.requests_served
+    counts the searches that reached it, and its postings list is the feed."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(synthetic_jobs(jobs), latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/api/remote-jobs'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--latency-ms', type=float, default=300)
+    args = parser.parse_args()
+
+    server, url = start_fake_feed(args.port, args.jobs, args.latency_ms)
+    print(f'Fake job feed with {args.jobs} jobs at {url} ({args.latency_ms:g} ms per request)')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Import-time report for the Flask app and the lazily loaded format backends.
+
+Runs `python -X importtime` in a fresh interpreter for each target, so every
+number is a cold import. Prints JSON with the cumulative import time per
+module (ms), the heaviest modules overall and the RSS after importing.
+
+Usage:
+    python benchmarks/import_report.py [--top 15] [--output imports.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold start of a worker, then each format backend on its own
+TARGETS = {
+    'app': 'import app',
+    'resume_generator': 'import resume_generator',
+    'docx_backend': 'import docx_backend',
+    'pdf_backend': 'import pdf_backend'
+}
+
+RSS_PROBE = (
+    "\ntry:\n"
+    "    import resource, sys\n"
+    "    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "    print('RSS_KB', rss // 1024 if sys.platform == 'darwin' else rss)\n"
+    "except ImportError:\n"
+    "    print('RSS_KB', 0)\n"
+)
+
+def profile_import(statement, top):
+    """Run one cold import and parse the -X importtime output"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement + RSS_PROBE],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = {
+            'self_ms': round(int(self_us) / 1000, 2),
+            'cumulative_ms': round(int(cumulative_us) / 1000, 2),
+            # Nesting depth of the import, from the indentation of the name
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2
+        }
+
+    rss_kb = next((int(line.split()[1]) for line in result.stdout.splitlines() if line.startswith('RSS_KB')), 0)
+    top_level = {name: info['cumulative_ms'] for name, info in modules.items() if info['depth'] == 0}
+    # The target itself and the modules it imports directly, cumulative
+    direct = {name: info['cumulative_ms'] for name, info in modules.items() if info['depth'] <= 1}
+    heaviest = sorted(modules.items(), key=lambda item: item[1]['self_ms'], reverse=True)[:top]
+    return {
+        'total_ms': round(sum(top_level.values()), 2),
+        'rss_kb': rss_kb,
+        'modules_ms': dict(sorted(direct.items(), key=lambda item: item[1], reverse=True)[:top]),
+        'heaviest_self_ms': {name: info['self_ms'] for name, info in heaviest},
+        'module_count': len(modules)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Report cold import times per module')
+    parser.add_argument('--top', type=int, default=15, help='number of heaviest modules to list')
+    parser.add_argument('--output', default=None, help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    report = {name: profile_import(statement, args.top) for name, statement in TARGETS.items()}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Job feed cache latency against a slow upstream.
+
+Starts the fake Remotive feed (fake_job_feed.py) with an artificial delay and
+times JobFeedCache.get() for a cold query, fresh hits, stale hits (served
+while a background refresh runs) and concurrent misses on one query, which
+should reach the upstream once. Reports milliseconds and the number of
+upstream requests as JSON.
+
+Usage: python benchmarks/job_feed_cache.py [--latency-ms 300] [--jobs 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_feed import RemotiveClient, JobFeedCache
+from fake_job_feed import start_fake_feed
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, round((time.perf_counter() - started) * 1000, 3)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--latency-ms', type=float, default=300)
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--hits', type=int, default=1000)
+    args = parser.parse_args()
+
+    server, url = start_fake_feed(jobs=args.jobs, latency_ms=args.latency_ms)
+    upstream = server.RequestHandlerClass
+    feed = JobFeedCache(RemotiveClient(url).search, ttl=60, stale_ttl=3600)
+    results = {'upstream_latency_ms': args.latency_ms, 'jobs': args.jobs}
+
+    jobs, results['cold_ms'] = timed(feed.get, 'python')
+    results['jobs_matched'] = len(jobs)
+
+    started = time.perf_counter()
+    for _ in range(args.hits):
+        feed.get('Python ')
+    results['fresh_hit_us'] = round((time.perf_counter() - started) / args.hits * 1e6, 3)
+
+    # Age the entry past its ttl: served at once while it is fetched again
+    feed.ttl = 0
+    before = upstream.requests_served
+    _, results['stale_hit_ms'] = timed(feed.get, 'python')
+    while feed.stats()['refreshing']:
+        time.sleep(0.01)
+    results['stale_refreshes'] = upstream.requests_served - before
+    feed.ttl = 60
+
+    before = upstream.requests_served
+    with ThreadPoolExecutor(16) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda _: feed.get('react typescript'), range(16)))
+        results['concurrent_misses_ms'] = round((time.perf_counter() - started) * 1000, 3)
+    results['concurrent_upstream_requests'] = upstream.requests_served - before
+
+    results['stats'] = feed.stats()
+    server.shutdown()
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
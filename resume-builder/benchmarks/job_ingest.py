@@ -0,0 +1,66 @@
+"""
+Incremental ingest cost of the local job store as the feed's delta grows.
+
+Loads a synthetic feed (fake_job_feed.py) into a fresh JobStore, then for each
+churn rate replaces that share of the postings (half edited, half swapped for
+new ones) and times JobStore.apply() on the changed feed, next to rebuilding
+the index from scratch. Fetching is left out; apply() still hashes the whole
+feed, but its writes and index updates only cover the delta.
+
+Usage: python benchmarks/job_ingest.py [jobs] [churn rates, e.g. 0,0.01,0.1,0.5]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_index import JobIndex
+from job_store import JobStore
+from fake_job_feed import synthetic_jobs
+
+DEFAULT_RATES = [0, 0.01, 0.1, 0.5]
+
+def churn(feed, rate, round_number):
+    """The feed with rate of its postings changed: half edited, half replaced"""
+    changed = int(len(feed) * rate)
+    edited = [dict(job, salary=f'edited {round_number}') for job in feed[:changed // 2]]
+    fresh = synthetic_jobs(changed - changed // 2, seed=round_number)
+    for i, job in enumerate(fresh):
+        job['id'] = 1000000 * round_number + i
+    return fresh + edited + feed[changed:]
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rates = [float(rate) for rate in sys.argv[2].split(',')] if len(sys.argv) > 2 else DEFAULT_RATES
+    feed = synthetic_jobs(size)
+    results = {'jobs': size, 'initial_load_ms': None, 'rates': []}
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobStore(os.path.join(directory, 'job_store.sqlite3'))
+        started = time.perf_counter()
+        store.apply(feed)
+        results['initial_load_ms'] = round((time.perf_counter() - started) * 1000, 2)
+
+        for round_number, rate in enumerate(rates, 1):
+            feed = churn(feed, rate, round_number)
+            started = time.perf_counter()
+            delta = store.apply(feed)
+            applied = time.perf_counter()
+            JobIndex(feed)
+            rebuilt = time.perf_counter()
+            results['rates'].append({
+                'churn': rate,
+                'added': delta['added'],
+                'updated': delta['updated'],
+                'removed': delta['removed'],
+                'apply_ms': round((applied - started) * 1000, 2),
+                'full_rebuild_ms': round((rebuilt - applied) * 1000, 2)
+            })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Before/after benchmark for /job-search filtering.
+
+"before" scans every job with substring checks on the location and job type
+and builds a result dict per match before slicing the first page, as
+/job-search used to. "after" intersects JobIndex posting lists and stops at
+the page size. Both run over the same synthetic feed (fake_job_feed.py).
+
+Usage: python benchmarks/job_search_filters.py [jobs] [searches]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_index import JobIndex
+from fake_job_feed import synthetic_jobs
+
+PAGE_SIZE = 18
+
+FILTERS = [
+    ('', ''), ('europe', ''), ('usa', 'contract'), ('germany', 'remote'),
+    ('worldwide', 'onsite'), ('uk', 'hybrid')
+]
+
+def summary(job):
+    return {
+        'title': job.get('title'),
+        'company': job.get('company_name'),
+        'location': job.get('candidate_required_location'),
+        'type': job.get('job_type'),
+        'description': job.get('description', '')[:200] + '...'
+    }
+
+def scan(jobs, location, job_type):
+    results = []
+    for job in jobs:
+        if location and location not in job.get('candidate_required_location', '').lower():
+            continue
+        if job_type:
+            jt = job.get('job_type', '').lower()
+            if job_type == 'remote' and 'remote' not in jt:
+                continue
+            if job_type == 'onsite' and 'remote' in jt:
+                continue
+            if job_type == 'hybrid' and 'hybrid' not in jt:
+                continue
+        results.append(summary(job))
+    return results[:PAGE_SIZE]
+
+def indexed(index, location, job_type):
+    return [summary(job) for job in index.search(location=location, job_type=job_type, limit=PAGE_SIZE)]
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    searches = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    jobs = synthetic_jobs(size)
+
+    started = time.perf_counter()
+    index = JobIndex(jobs)
+    results = {
+        'jobs': size,
+        'index_build_ms': round((time.perf_counter() - started) * 1000, 2),
+        'tokens': len(index.tokens),
+        'filters': []
+    }
+
+    for location, job_type in FILTERS:
+        assert scan(jobs, location, job_type) == indexed(index, location, job_type)
+        timings = {}
+        for name, run, source in (('before', scan, jobs), ('after', indexed, index)):
+            started = time.perf_counter()
+            for _ in range(searches):
+                run(source, location, job_type)
+            timings[name] = (time.perf_counter() - started) / searches * 1e6
+        results['filters'].append({
+            'location': location,
+            'job_type': job_type,
+            'before_us': round(timings['before'], 2),
+            'after_us': round(timings['after'], 2),
+            'speedup': round(timings['before'] / timings['after'], 1)
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
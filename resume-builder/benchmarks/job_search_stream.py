@@ -0,0 +1,66 @@
+"""
+Streamed (NDJSON) vs materialized /job-search responses over a large feed.
+
+Serves a synthetic feed (fake_job_feed.py) without latency, warms the job feed
+cache, then requests every match of an unfiltered search through the app's
+test client: once as an NDJSON stream, timing the first line and the whole
+stream, and once built as a single JSON list of all matches, the way a
+response without pagination would. Peak Python memory (tracemalloc) is
+reported for both.
+
+Usage: python benchmarks/job_search_stream.py [jobs]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_job_feed import start_fake_feed
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    server, url = start_fake_feed(jobs=size, latency_ms=0)
+    os.environ['JOB_FEED_URL'] = url
+    os.environ['JOB_FEED_INGEST_INTERVAL'] = '0'
+    os.chdir(tempfile.mkdtemp())
+    import app
+    client = app.app.test_client()
+    index = app.job_feed.get('')
+    results = {'jobs': size}
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    response = client.post('/job-search', json={'stream': True}, buffered=False)
+    chunks = iter(response.response)
+    next(chunks)
+    first = time.perf_counter()
+    lines = 1 + sum(1 for _ in chunks)
+    finished = time.perf_counter()
+    response.close()
+    results['stream'] = {
+        'lines': lines,
+        'first_line_ms': round((first - started) * 1000, 2),
+        'total_ms': round((finished - started) * 1000, 2),
+        'peak_kb': tracemalloc.get_traced_memory()[1] // 1024
+    }
+
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    body = json.dumps({'jobs': [app.job_summary(job) for job in index.search()]})
+    finished = time.perf_counter()
+    results['materialized'] = {
+        'bytes': len(body),
+        'total_ms': round((finished - started) * 1000, 2),
+        'peak_kb': tracemalloc.get_traced_memory()[1] // 1024
+    }
+    tracemalloc.stop()
+    server.shutdown()
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
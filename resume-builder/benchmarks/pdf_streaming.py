@@ -0,0 +1,89 @@
+"""
+Peak memory of list vs streaming PDF builds as the entry count grows.
+
+"list" builds the whole story with PdfFlowableFactory.build_story() before
+doc.build(), "stream" hands doc.build() a FlowableStream over iter_story()
+and compresses each page as it is finished (StreamingCanvas). Memory is
+measured with tracemalloc around the build only; the profile and layout
+exist beforehand.
+
+reportlab writes the file in save(), after the last page, so finished pages
+stay in memory until then. The build is reported in two parts:
+  layout_kb   peak while pages are laid out, less what the finished pages
+              hold when save() starts; the flowables' working set, which
+              should stay flat when streaming
+  retained_kb memory held by finished pages when save() starts
+  peak_kb     overall peak, including save() serializing the file
+  pdf_kb      size of the PDF
+Usage: python benchmarks/pdf_streaming.py [sizes, e.g. 100,500,1000,2000]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate
+from reportlab.pdfgen.canvas import Canvas
+from pdf_backend import PdfFlowableFactory, FlowableStream, StreamingCanvas
+from resume_layout import build_layout
+from render_suite import synthetic_profile
+
+DEFAULT_SIZES = [100, 250, 500, 1000, 2000]
+
+class MeasuredCanvas(Canvas):
+    """Records traced memory when save() starts"""
+    at_save = None
+
+    def save(self):
+        MeasuredCanvas.at_save = tracemalloc.get_traced_memory()
+        Canvas.save(self)
+
+class MeasuredStreamingCanvas(MeasuredCanvas, StreamingCanvas):
+    pass
+
+def build(layout, stream):
+    # No fragment cache, so neither mode keeps flowables between builds
+    factory = PdfFlowableFactory('modern')
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    if stream:
+        doc.build(FlowableStream(factory.iter_story(layout)), canvasmaker=MeasuredStreamingCanvas)
+    else:
+        doc.build(factory.build_story(layout), canvasmaker=MeasuredCanvas)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    retained, layout_peak = MeasuredCanvas.at_save
+    return {
+        'pages': doc.page,
+        'pdf_kb': round(len(buffer.getvalue()) / 1024, 1),
+        'layout_kb': round((layout_peak - retained) / 1024, 1),
+        'retained_kb': round(retained / 1024, 1),
+        'peak_kb': round(peak / 1024, 1),
+        'seconds': round(elapsed, 3)
+    }
+
+def main():
+    sizes = [int(size) for size in sys.argv[1].split(',')] if len(sys.argv) > 1 else DEFAULT_SIZES
+    results = []
+    for entries in sizes:
+        layout = build_layout(synthetic_profile(entries))
+        results.append({
+            'entries': entries,
+            'list': build(layout, stream=False),
+            'stream': build(layout, stream=True)
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
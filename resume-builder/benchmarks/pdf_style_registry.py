@@ -0,0 +1,85 @@
+"""
+Before/after benchmark for the PDF style registry.
+
+"before" builds a fresh PdfFlowableFactory (getSampleStyleSheet() plus the
+three custom ParagraphStyles) for every render, which is what
+_generate_pdf_resume used to do. "after" reuses the per-template factory.
+
+Usage: python benchmarks/pdf_style_registry.py [renders]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate
+from pdf_backend import PdfFlowableFactory
+from resume_layout import build_layout
+
+PROFILE = {
+    'name': 'Jane Doe',
+    'headline': 'Senior Software Engineer',
+    'email': 'jane.doe@email.com',
+    'phone': '+1 (555) 123-4567',
+    'location': 'San Francisco, CA',
+    'summary': 'Experienced software engineer with expertise in distributed systems and developer tooling.',
+    'experience': [
+        {
+            'title': 'Senior Software Engineer',
+            'company': 'Tech Corp',
+            'duration': 'Jan 2022 - Present',
+            'description': 'Led development of microservices architecture and mentored junior developers.'
+        },
+        {
+            'title': 'Software Engineer',
+            'company': 'Startup Inc',
+            'duration': 'Mar 2020 - Dec 2021',
+            'description': 'Developed full-stack web applications using React and Node.js.'
+        }
+    ],
+    'education': [
+        {'degree': 'BSc Computer Science', 'institution': 'UC Berkeley', 'year': '2019'}
+    ],
+    'skills': ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 'PostgreSQL']
+}
+
+LAYOUT = build_layout(PROFILE)
+
+def story_only(renders, reuse_factory):
+    factory = PdfFlowableFactory('modern')
+    started = time.perf_counter()
+    for _ in range(renders):
+        if not reuse_factory:
+            factory = PdfFlowableFactory('modern')
+        factory.build_story(LAYOUT)
+    return time.perf_counter() - started
+
+def full_render(renders, reuse_factory):
+    factory = PdfFlowableFactory('modern')
+    started = time.perf_counter()
+    for _ in range(renders):
+        if not reuse_factory:
+            factory = PdfFlowableFactory('modern')
+        SimpleDocTemplate(io.BytesIO(), pagesize=letter).build(factory.build_story(LAYOUT))
+    return time.perf_counter() - started
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    results = {'renders': renders}
+    for name, run in (('story', story_only), ('full_render', full_render)):
+        before = run(renders, reuse_factory=False)
+        after = run(renders, reuse_factory=True)
+        results[name] = {
+            'before_ms_per_render': round(before / renders * 1000, 4),
+            'after_ms_per_render': round(after / renders * 1000, 4),
+            'speedup': round(before / after, 2)
+        }
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""
+Render benchmark suite for ResumeGenerator.
+
+Builds synthetic profiles of increasing size, renders every template x format
+and reports latency percentiles, throughput and peak memory as JSON so runs
+can be compared.
+
+Usage:
+    python benchmarks/render_suite.py --sizes 1,10,100,500 --iterations 20 --output bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_generator import ResumeGenerator, MIME_TYPES, DOCX_WRITERS
+from format_backends import get_backend
+
+DEFAULT_SIZES = [1, 10, 50, 100, 500]
+
+WORDS = (
+    'led designed built migrated scaled optimized platform service pipeline data '
+    'customer team latency throughput cloud python api frontend backend analytics '
+    'reliability security mentoring roadmap delivery stakeholders revenue growth'
+).split()
+
+def synthetic_profile(entries, seed=0):
+    """Profile with `entries` experience entries, a long summary and
+    hundreds of skills once the profile is large"""
+    rng = random.Random(seed)
+
+    def sentence(words):
+        return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+    return {
+        'name': 'Benchmark Candidate',
+        'headline': 'Principal Engineer',
+        'email': 'candidate@example.com',
+        'phone': '+1 (555) 000-0000',
+        'location': 'Remote',
+        'summary': ' '.join(sentence(20) for _ in range(max(1, entries // 10))),
+        'experience': [
+            {
+                'title': f'Engineer {i}',
+                'company': f'Company {i}',
+                'location': 'Remote',
+                'duration': f'{2000 + i % 25} - {2001 + i % 25}',
+                'description': ' '.join(sentence(15) for _ in range(3))
+            }
+            for i in range(entries)
+        ],
+        'education': [
+            {
+                'degree': f'Degree {i}',
+                'school': f'University {i}',
+                'institution': f'University {i}',
+                'location': 'Somewhere',
+                'duration': '2010 - 2014',
+                'year': '2014',
+                'gpa': '3.8'
+            }
+            for i in range(max(1, entries // 50))
+        ],
+        'skills': [f'skill-{i}' for i in range(min(entries * 2, 400))]
+    }
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+def max_rss_kb():
+    if resource is None:
+        return 0
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def latency_summary(latencies):
+    return {
+        'min': round(min(latencies), 3),
+        'p50': round(percentile(latencies, 50), 3),
+        'p90': round(percentile(latencies, 90), 3),
+        'p99': round(percentile(latencies, 99), 3),
+        'max': round(max(latencies), 3),
+        'mean': round(sum(latencies) / len(latencies), 3)
+    }
+
+def run_case(generator, profile, template, format, iterations, docx_writer='python-docx'):
+    """Render one case `iterations` times, bypassing the render cache. Full
+    renders start from an empty fragment cache; edit renders change one
+    experience entry per render, like the editor's regenerate loop."""
+    fragment_cache = getattr(get_backend(format), 'fragment_cache', None)
+
+    # Warm-up render so first-use costs do not skew the percentiles
+    generator._render_to(profile, template, format, io.BytesIO(), docx_writer)
+
+    latencies = []
+    sizes = []
+    rss_before = max_rss_kb()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if fragment_cache is not None:
+            fragment_cache.clear()
+        buffer = io.BytesIO()
+        render_started = time.perf_counter()
+        generator._render_to(profile, template, format, buffer, docx_writer)
+        latencies.append((time.perf_counter() - render_started) * 1000)
+        sizes.append(buffer.getbuffer().nbytes)
+    elapsed = time.perf_counter() - started
+    rss_growth = max_rss_kb() - rss_before
+
+    edit_latencies = []
+    edited = dict(profile, experience=[dict(exp) for exp in profile['experience']])
+    for iteration in range(iterations):
+        edited['experience'][0]['description'] = f'Edited description {iteration}.'
+        render_started = time.perf_counter()
+        generator._render_to(edited, template, format, io.BytesIO(), docx_writer)
+        edit_latencies.append((time.perf_counter() - render_started) * 1000)
+
+    # Peak Python heap of one render, measured separately since tracing slows renders down
+    tracemalloc.start()
+    generator._render_to(profile, template, format, io.BytesIO(), docx_writer)
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'template': template,
+        'format': format,
+        'iterations': iterations,
+        'latency_ms': latency_summary(latencies),
+        'edit_latency_ms': latency_summary(edit_latencies),
+        'throughput_per_s': round(iterations / elapsed, 2),
+        'output_bytes': sizes[-1],
+        'peak_traced_kb': peak_traced // 1024,
+        'max_rss_growth_kb': rss_growth
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ResumeGenerator renders')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='comma-separated experience entry counts')
+    parser.add_argument('--iterations', type=int, default=20, help='renders per case')
+    parser.add_argument('--templates', default=None, help='comma-separated templates (default: all)')
+    parser.add_argument('--formats', default=None, help='comma-separated formats (default: all)')
+    parser.add_argument('--docx-writer', default='python-docx', choices=DOCX_WRITERS,
+                        help='DOCX writer to benchmark')
+    parser.add_argument('--output', default=None, help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = ResumeGenerator()
+    templates = args.templates.split(',') if args.templates else list(generator.templates)
+    formats = args.formats.split(',') if args.formats else list(MIME_TYPES)
+
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': args.iterations,
+        'docx_writer': args.docx_writer,
+        'cases': []
+    }
+    for size in [int(size) for size in args.sizes.split(',')]:
+        profile = synthetic_profile(size, seed=size)
+        for template in templates:
+            for format in formats:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    case = run_case(generator, profile, template, format, args.iterations, args.docx_writer)
+                case['entries'] = size
+                report['cases'].append(case)
+                print(f"{size:>4} entries {template:>8} {format:>4}: "
+                      f"p50 {case['latency_ms']['p50']} ms, edit p50 {case['edit_latency_ms']['p50']} ms, "
+                      f"{case['throughput_per_s']}/s", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
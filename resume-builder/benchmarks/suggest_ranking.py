@@ -0,0 +1,61 @@
+"""
+BM25 ranking cost for /suggest-jobs as the job corpus grows.
+
+For each corpus size, indexes a synthetic feed (fake_job_feed.py), builds the
+ranker's precomputed BM25 weights and times ranking the feed against a full
+profile (all skills, experience titles, headline and summary).
+
+Usage: python benchmarks/suggest_ranking.py [sizes, e.g. 1000,5000,20000] [rankings]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_index import JobIndex, profile_terms
+from fake_job_feed import synthetic_jobs
+
+DEFAULT_SIZES = [1000, 5000, 20000]
+
+PROFILE = {
+    'headline': 'Senior Backend Engineer',
+    'summary': 'Backend engineer building data pipelines with Kafka and Spark on AWS, '
+               'with a focus on reliability and developer tooling.',
+    'experience': [
+        {'title': 'Senior Backend Engineer'},
+        {'title': 'Data Engineer'},
+        {'title': 'Software Engineer'}
+    ],
+    'skills': ['Python', 'Django', 'Flask', 'AWS', 'Docker', 'Kubernetes', 'PostgreSQL', 'Kafka', 'Terraform']
+}
+
+def main():
+    sizes = [int(size) for size in sys.argv[1].split(',')] if len(sys.argv) > 1 else DEFAULT_SIZES
+    rankings = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    terms = profile_terms(PROFILE)
+    results = {'query_terms': len(terms), 'sizes': []}
+
+    for size in sizes:
+        jobs = synthetic_jobs(size)
+        started = time.perf_counter()
+        index = JobIndex(jobs)
+        indexed = time.perf_counter()
+        ranker = index.ranker()
+        built = time.perf_counter()
+        for _ in range(rankings):
+            ranker.top(terms, 10)
+        ranked = time.perf_counter()
+        results['sizes'].append({
+            'jobs': size,
+            'postings': len(ranker.jobs),
+            'index_ms': round((indexed - started) * 1000, 2),
+            'ranker_build_ms': round((built - indexed) * 1000, 2),
+            'rank_ms': round((ranked - built) / rankings * 1000, 3)
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
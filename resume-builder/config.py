@@ -38,6 +38,71 @@ class Config:
     UPLOAD_FOLDER = 'generated_resumes'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
+    # In-memory resume store (delivery='memory' on /generate-resume)
+    MEMORY_STORE_MAX_ITEMS = int(os.getenv('MEMORY_STORE_MAX_ITEMS', '200'))
+    MEMORY_STORE_MAX_BYTES = int(os.getenv('MEMORY_STORE_MAX_BYTES', str(64 * 1024 * 1024)))
+    MEMORY_STORE_TTL = int(os.getenv('MEMORY_STORE_TTL', '300'))  # seconds
+    
+    # Content-addressed render cache (memory LRU in front of generated_resumes/)
+    RENDER_CACHE_MAX_ITEMS = int(os.getenv('RENDER_CACHE_MAX_ITEMS', '128'))
+    RENDER_CACHE_MAX_MEMORY_BYTES = int(os.getenv('RENDER_CACHE_MAX_MEMORY_BYTES', str(32 * 1024 * 1024)))
+    # Rendered section fragments per backend, so an edit only re-renders what changed
+    FRAGMENT_CACHE_MAX_ITEMS = int(os.getenv('FRAGMENT_CACHE_MAX_ITEMS', '2048'))
+    # PDFs with at least this many entries are built from a lazy flowable stream
+    # instead of a full story list, so memory stays flat for very long resumes
+    PDF_STREAM_MIN_ENTRIES = int(os.getenv('PDF_STREAM_MIN_ENTRIES', '200'))
+    
+    # Retention for generated_resumes/ (0 disables a limit)
+    STORAGE_MAX_AGE = int(os.getenv('STORAGE_MAX_AGE', str(30 * 24 * 3600)))  # seconds since last access
+    STORAGE_MAX_BYTES = int(os.getenv('STORAGE_MAX_BYTES', str(1024 * 1024 * 1024)))
+    STORAGE_USER_QUOTA_BYTES = int(os.getenv('STORAGE_USER_QUOTA_BYTES', str(50 * 1024 * 1024)))
+    STORAGE_EVICTION_INTERVAL = int(os.getenv('STORAGE_EVICTION_INTERVAL', '300'))  # seconds
+    
+    # SQLite index behind /list-resumes, kept outside generated_resumes/
+    RESUME_INDEX_PATH = os.getenv('RESUME_INDEX_PATH', 'resume_index.sqlite3')
+    LIST_RESUMES_PAGE_SIZE = int(os.getenv('LIST_RESUMES_PAGE_SIZE', '50'))
+    LIST_RESUMES_MAX_PAGE_SIZE = int(os.getenv('LIST_RESUMES_MAX_PAGE_SIZE', '200'))
+    # Lets owner=all list every session's files, e.g. for an admin deployment
+    LIST_RESUMES_ALLOW_ALL = os.getenv('LIST_RESUMES_ALLOW_ALL', 'false').lower() == 'true'
+    
+    # Cache lifetime of content-addressed downloads, which never change once written
+    DOWNLOAD_MAX_AGE = int(os.getenv('DOWNLOAD_MAX_AGE', str(365 * 24 * 3600)))  # seconds
+    
+    # Output format backends to load at startup (comma-separated, e.g. "docx,pdf").
+    # Formats not listed are imported on their first render.
+    PRELOAD_FORMATS = [f for f in os.getenv('PRELOAD_FORMATS', '').split(',') if f]
+    
+    # Batch generation (/generate-resumes-batch)
+    BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '0'))  # 0 = one per CPU core
+    BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '500'))  # profiles x templates x formats
+    
+    # Files that may be named in one /export-resumes request
+    EXPORT_MAX_FILES = int(os.getenv('EXPORT_MAX_FILES', '500'))
+    
+    # Threads rendering the additional formats of a multi-format request
+    RENDER_POOL_THREADS = int(os.getenv('RENDER_POOL_THREADS', '4'))
+    
+    # Asynchronous render jobs ("async": true on /generate-resume)
+    RENDER_QUEUE_WORKERS = int(os.getenv('RENDER_QUEUE_WORKERS', '2'))
+    RENDER_QUEUE_MAX_DEPTH = int(os.getenv('RENDER_QUEUE_MAX_DEPTH', '100'))  # waiting jobs before 503
+    RENDER_JOB_TTL = int(os.getenv('RENDER_JOB_TTL', '600'))  # seconds a finished job stays queryable
+    
+    # Job feed behind /job-search and /suggest-jobs (Remotive's API, or anything serving the same JSON)
+    JOB_FEED_URL = os.getenv('JOB_FEED_URL', 'https://remotive.com/api/remote-jobs')
+    JOB_FEED_TIMEOUT = float(os.getenv('JOB_FEED_TIMEOUT', '10'))  # seconds
+    JOB_FEED_TTL = int(os.getenv('JOB_FEED_TTL', '300'))  # seconds a search result is fresh
+    JOB_FEED_STALE_TTL = int(os.getenv('JOB_FEED_STALE_TTL', '3600'))  # then served while refreshed in the background
+    JOB_FEED_MAX_QUERIES = int(os.getenv('JOB_FEED_MAX_QUERIES', '256'))
+    JOB_SEARCH_PAGE_SIZE = int(os.getenv('JOB_SEARCH_PAGE_SIZE', '18'))  # jobs per /job-search page
+    JOB_SEARCH_MAX_PAGE_SIZE = int(os.getenv('JOB_SEARCH_MAX_PAGE_SIZE', '100'))
+    # Background ingest of the whole feed into a local store that the job endpoints
+    # search instead of the per-query cache (0 disables it)
+    JOB_FEED_INGEST_INTERVAL = int(os.getenv('JOB_FEED_INGEST_INTERVAL', '600'))  # seconds
+    JOB_STORE_PATH = os.getenv('JOB_STORE_PATH', 'job_store.sqlite3')
+    JOB_STORE_TOMBSTONE_TTL = int(os.getenv('JOB_STORE_TOMBSTONE_TTL', str(7 * 24 * 3600)))  # seconds
+    JOB_FEED_INGEST_RETRY = int(os.getenv('JOB_FEED_INGEST_RETRY', '15'))  # seconds before retrying a failed pull, doubling
+    JOB_STORE_REFRESH_INTERVAL = int(os.getenv('JOB_STORE_REFRESH_INTERVAL', '30'))  # seconds between non-writer index refreshes
+    
     # Resume Templates
     AVAILABLE_TEMPLATES = ['modern', 'classic', 'minimal']
     DEFAULT_TEMPLATE = 'modern'
@@ -0,0 +1,180 @@
+from functools import partial
+from io import BytesIO
+from docx import Document
+from docx.shared import Inches, Pt
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.style import WD_STYLE_TYPE
+from docx_fast_writer import FastDocxWriter
+from render_cache import FragmentCache
+from config import Config
+
+# Page margins (inches) and named paragraph styles for each DOCX template.
+# Style tuples are (name, font size, bold, italic, underline, centered).
+DOCX_TEMPLATE_LAYOUTS = {
+    'modern': {
+        'margins': {'top': 0.5, 'bottom': 0.5, 'left': 0.75, 'right': 0.75},
+        'font': 'Calibri',
+        'styles': [
+            ('Resume Name', 24, True, False, False, True),
+            ('Resume Headline', 14, False, True, False, True),
+            ('Resume Contact', 10, False, False, False, True),
+            ('Resume Section', 14, True, False, True, False),
+            ('Resume Job Title', 12, True, False, False, False),
+            ('Resume Meta', 10, False, True, False, False),
+            ('Resume Body', 11, False, False, False, False),
+        ]
+    }
+}
+
+# Classic and minimal are still placeholders that render with the modern layout
+DOCX_TEMPLATE_LAYOUTS['classic'] = DOCX_TEMPLATE_LAYOUTS['modern']
+DOCX_TEMPLATE_LAYOUTS['minimal'] = DOCX_TEMPLATE_LAYOUTS['modern']
+
+# Templates that support docx_writer='fast' (direct OOXML instead of python-docx)
+FAST_DOCX_TEMPLATES = ('modern',)
+
+class DocxBackend:
+    """Renders DOCX resumes. Base documents (and fast writers) for every template
+    are built when the backend is loaded, so renders only append content.
+    The fast writer caches the markup of every fragment, so regenerating an
+    edited resume only renders the fragments that changed."""
+    
+    def __init__(self):
+        self.templates = {
+            'modern': self._generate_modern_resume,
+            'classic': self._generate_classic_resume,
+            'minimal': self._generate_minimal_resume
+        }
+        
+        # Serialized base documents and direct OOXML writers keyed by template
+        self._base_documents = {}
+        self._fast_writers = {}
+        self.fragment_cache = FragmentCache(Config.FRAGMENT_CACHE_MAX_ITEMS)
+        for template, layout in DOCX_TEMPLATE_LAYOUTS.items():
+            self._base_documents[template] = self._build_base_document(layout)
+            if template in FAST_DOCX_TEMPLATES:
+                self._fast_writers[template] = FastDocxWriter(self._base_documents[template])
+    
+    def render(self, layout, template, target, docx_writer='python-docx', **options):
+        """Render a resume layout into a file path or a writable buffer"""
+        if docx_writer == 'fast' and template in self._fast_writers:
+            writer = self._fast_writers[template]
+            body = ''.join(
+                self.fragment_cache.get_or_render((template, key), partial(self._fragment_xml, writer, paragraphs))
+                for key, paragraphs in self._modern_fragments(layout)
+            )
+            writer.write_body(body, target)
+        else:
+            self.templates[template](layout, target)
+    
+    def _build_base_document(self, layout):
+        """Create an empty document with the template's margins and named styles"""
+        doc = Document()
+        
+        for section in doc.sections:
+            section.top_margin = Inches(layout['margins']['top'])
+            section.bottom_margin = Inches(layout['margins']['bottom'])
+            section.left_margin = Inches(layout['margins']['left'])
+            section.right_margin = Inches(layout['margins']['right'])
+        
+        for name, size, bold, italic, underline, centered in layout['styles']:
+            style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            style.base_style = doc.styles['Normal']
+            style.font.name = layout['font']
+            style.font.size = Pt(size)
+            style.font.bold = bold
+            style.font.italic = italic
+            style.font.underline = underline
+            if centered:
+                style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        buffer = BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+    
+    def _new_document(self, template):
+        """Clone the pre-built base document for a template"""
+        return Document(BytesIO(self._base_documents[template]))
+    
+    def _generate_modern_resume(self, layout, filepath):
+        """Generate modern style resume"""
+        doc = self._new_document('modern')
+        for style, text in self._modern_paragraphs(layout):
+            doc.add_paragraph(text, style=style)
+        
+        # Save document (filepath may also be a writable buffer)
+        print(f"[DEBUG] Saving resume to: {filepath}")
+        try:
+            doc.save(filepath)
+            print(f"[DEBUG] Resume saved successfully: {filepath}")
+        except Exception as e:
+            print(f"[ERROR] Failed to save resume: {e}")
+    
+    def _modern_paragraphs(self, layout):
+        """Yield (style, text) for every paragraph of the modern template.
+        Blank spacing paragraphs are (None, '')."""
+        for _, paragraphs in self._modern_fragments(layout):
+            yield from paragraphs()
+    
+    def _modern_fragments(self, layout):
+        """Split the modern template into independently rendered fragments: the
+        header, each section heading, each entry and each other section body.
+        Yields (fragment key, function returning the fragment's paragraphs);
+        the key holds the layout node, so it changes whenever the content does."""
+        yield ('header', layout.name, layout.headline, layout.contact), partial(self._header_paragraphs, layout)
+        for section in layout.sections:
+            yield ('heading', section.title), partial(self._section_header, section.title)
+            if section.kind == 'entries':
+                for entry in section.content:
+                    yield ('entry', entry), partial(self._entry_paragraphs, entry)
+            else:
+                yield ('body', section), partial(self._section_body, section)
+    
+    def _fragment_xml(self, writer, paragraphs):
+        return writer.paragraphs_xml(paragraphs())
+    
+    def _header_paragraphs(self, layout):
+        # Header with name and contact info
+        yield 'Resume Name', layout.name
+        
+        # Headline
+        yield None, ''
+        yield 'Resume Headline', layout.headline
+        
+        # Contact information
+        yield 'Resume Contact', ' | '.join(layout.contact)
+        
+        yield None, ''  # Spacing
+    
+    def _entry_paragraphs(self, entry):
+        # Title and organization
+        yield 'Resume Job Title', f"{entry.title} - {entry.organization}"
+        
+        # Dates, location and details such as a GPA
+        yield 'Resume Meta', ' | '.join((entry.dates, entry.location) + entry.details)
+        
+        # Description
+        if entry.description:
+            yield 'Resume Body', entry.description
+        yield None, ''  # Spacing
+    
+    def _section_body(self, section):
+        if section.kind == 'list':
+            yield 'Resume Body', ", ".join(section.content)
+        else:
+            for text in section.content:
+                yield 'Resume Body', text
+        yield None, ''  # Spacing
+    
+    def _section_header(self, title):
+        """Section header paragraphs for modern template"""
+        yield 'Resume Section', title
+        yield None, ''  # Spacing
+
+    def _generate_classic_resume(self, layout, filepath):
+        # Placeholder: use modern resume for now
+        self._generate_modern_resume(layout, filepath)
+
+    def _generate_minimal_resume(self, layout, filepath):
+        # Placeholder: use modern resume for now
+        self._generate_modern_resume(layout, filepath)
@@ -0,0 +1,90 @@
+import re
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+DOCUMENT_PART = 'word/document.xml'
+
+# Control characters lxml refuses, so python-docx fails on them as well
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Characters python-docx turns into <w:tab/> and <w:br/> elements inside a run
+RUN_BREAKS = re.compile('([\t\r\n])')
+
+class FastDocxWriter:
+    """Writes a document from (style name, text) paragraphs straight to OOXML.
+
+    Every part of the base document except word/document.xml is packaged once
+    when the writer is created. A render only fills the document.xml skeleton
+    with escaped paragraphs and appends it to a copy of that package, which
+    produces the same markup as python-docx's add_paragraph(text, style)."""
+
+    def __init__(self, base_document):
+        with zipfile.ZipFile(BytesIO(base_document)) as source:
+            document_xml = source.read(DOCUMENT_PART).decode('utf-8')
+
+            static_package = BytesIO()
+            with zipfile.ZipFile(static_package, 'w', zipfile.ZIP_DEFLATED) as package:
+                for info in source.infolist():
+                    if info.filename != DOCUMENT_PART:
+                        package.writestr(info, source.read(info.filename))
+
+        # Paragraphs go right before the body's section properties
+        body_end = document_xml.index('<w:sectPr')
+        self._head = document_xml[:body_end]
+        self._tail = document_xml[body_end:]
+        self._static_package = static_package.getvalue()
+        self._style_ids = {}
+
+    def write(self, paragraphs, target):
+        """Write paragraphs to a file path or a writable buffer"""
+        self.write_body(self.paragraphs_xml(paragraphs), target)
+
+    def paragraphs_xml(self, paragraphs):
+        """Body markup of (style name, text) paragraphs, which can be cached and
+        passed to write_body() later"""
+        return ''.join(self._paragraph_xml(style, text) for style, text in paragraphs)
+
+    def write_body(self, body_xml, target):
+        """Write a document with the given body markup to a file path or a writable buffer"""
+        buffer = BytesIO(self._static_package)
+        buffer.seek(0, 2)
+        with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as package:
+            package.writestr(DOCUMENT_PART, self._head + body_xml + self._tail)
+
+        if isinstance(target, str):
+            with open(target, 'wb') as f:
+                f.write(buffer.getvalue())
+        else:
+            target.write(buffer.getvalue())
+
+    def _style_id(self, style):
+        # python-docx derives custom style ids by removing spaces from the name
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            style_id = self._style_ids[style] = escape(style.replace(' ', ''), {'"': '&quot;'})
+        return style_id
+
+    def _paragraph_xml(self, style, text):
+        if not style and not text:
+            return '<w:p/>'
+
+        xml = ['<w:p>']
+        if style:
+            xml.append(f'<w:pPr><w:pStyle w:val="{self._style_id(style)}"/></w:pPr>')
+        if text:
+            if INVALID_XML_CHARS.search(text):
+                raise ValueError('All strings must be XML compatible: Unicode or ASCII, '
+                                 'no NULL bytes or control characters')
+            xml.append('<w:r>')
+            for piece in RUN_BREAKS.split(text):
+                if piece == '\t':
+                    xml.append('<w:tab/>')
+                elif piece == '\r' or piece == '\n':
+                    xml.append('<w:br/>')
+                elif piece:
+                    space = ' xml:space="preserve"' if piece.strip() != piece else ''
+                    xml.append(f'<w:t{space}>{escape(piece)}</w:t>')
+            xml.append('</w:r>')
+        xml.append('</w:p>')
+        return ''.join(xml)
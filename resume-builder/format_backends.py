@@ -0,0 +1,54 @@
+import importlib
+import threading
+import time
+
+# Output formats: (backend module, backend class, content type). Backend modules
+# pull in heavy document libraries, so they are only imported on first use.
+BACKENDS = {
+    'docx': ('docx_backend', 'DocxBackend',
+             'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+    'pdf': ('pdf_backend', 'PdfBackend', 'application/pdf'),
+    'txt': ('text_backend', 'TextBackend', 'text/plain; charset=utf-8'),
+    'md': ('text_backend', 'MarkdownBackend', 'text/markdown; charset=utf-8'),
+    'json': ('text_backend', 'JsonResumeBackend', 'application/json')
+}
+
+# Supported output formats and their content types
+MIME_TYPES = {format: spec[2] for format, spec in BACKENDS.items()}
+
+# DOCX writers: python-docx object model, or direct OOXML (modern template only)
+DOCX_WRITERS = ('python-docx', 'fast')
+
+_backends = {}
+_load_times = {}
+_lock = threading.Lock()
+
+def register_backend(format, module_name, class_name, mimetype):
+    """Add an output format without importing its backend"""
+    BACKENDS[format] = (module_name, class_name, mimetype)
+    MIME_TYPES[format] = mimetype
+
+def get_backend(format):
+    """Return the backend for a format, importing and warming it up on first use"""
+    backend = _backends.get(format)
+    if backend is None:
+        with _lock:
+            backend = _backends.get(format)
+            if backend is None:
+                module_name, class_name, _ = BACKENDS[format]
+                started = time.perf_counter()
+                module = importlib.import_module(module_name)
+                imported = time.perf_counter()
+                backend = getattr(module, class_name)()
+                _load_times[format] = {
+                    'module': module_name,
+                    'import_ms': round((imported - started) * 1000, 2),
+                    'warm_up_ms': round((time.perf_counter() - imported) * 1000, 2)
+                }
+                print(f"[DEBUG] Loaded {format} backend in {(time.perf_counter() - started) * 1000:.1f} ms")
+                _backends[format] = backend
+    return backend
+
+def loaded_backends():
+    """Import and warm-up times of the backends loaded in this process"""
+    return dict(_load_times)
@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import requests
+from job_index import JobIndex
+
+# Fields of a Remotive job that /job-search and /suggest-jobs use; the rest of
+# each posting is dropped before caching
+JOB_FIELDS = (
+    'id', 'url', 'title', 'company_name', 'company_logo_url', 'category', 'job_type',
+    'publication_date', 'candidate_required_location', 'salary', 'description'
+)
+
+def normalize_query(query):
+    """Case- and whitespace-insensitive cache key for a search query"""
+    return ' '.join((query or '').lower().split())
+
+class RemotiveClient:
+    """Search the Remotive remote-jobs API. url can point at another server with
+    the same API, such as benchmarks/fake_job_feed.py."""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def search(self, query):
+        """Return the jobs matching a query, trimmed to JOB_FIELDS"""
+        params = {'search': query} if query else None
+        response = self._session.get(self.url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return [
+            {field: job[field] for field in JOB_FIELDS if field in job}
+            for job in response.json().get('jobs', [])
+        ]
+
+class JobFeedCache:
+    """Cache of job searches in front of a slow upstream, keyed by normalized query.
+    Each result is stored as a JobIndex, built once when it is fetched.
+
+    A result younger than ttl is served as is. An older one is still served
+    for up to stale_ttl more seconds while a background thread fetches a fresh
+    copy (stale-while-revalidate), so only a query nobody asked recently waits
+    for the upstream. Concurrent misses on one query share a single fetch, and
+    if a fetch fails the last result is served however old it is."""
+
+    def __init__(self, fetch, ttl=300, stale_ttl=3600, max_queries=256, refresh_workers=2):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_queries = max_queries
+
+        self._entries = OrderedDict()  # query -> (JobIndex, fetched at)
+        self._pending = {}  # query -> Future of the fetch in progress
+        self._lock = threading.Lock()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='job-feed')
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get(self, query):
+        """JobIndex of the jobs for a query, from the cache whenever it holds a usable result"""
+        query = normalize_query(query)
+        fetch_here = False
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None:
+                index, fetched = entry
+                age = time.time() - fetched
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(query)
+                    if age < self.ttl:
+                        self.hits += 1
+                    else:
+                        self.stale_hits += 1
+                        if query not in self._pending:
+                            self._pending[query] = self._refresh_pool.submit(self._load, query)
+                    return index
+
+            self.misses += 1
+            future = self._pending.get(query)
+            if future is None:
+                future = self._pending[query] = Future()
+                fetch_here = True
+
+        if fetch_here:
+            try:
+                future.set_result(self._load(query))
+            except Exception as e:
+                future.set_exception(e)
+        try:
+            return future.result()
+        except Exception:
+            if entry is None:
+                raise
+            print(f"[DEBUG] Serving expired job feed for '{query}'")
+            return entry[0]
+
+    def _load(self, query):
+        """Fetch a query from the upstream, index it and cache the index"""
+        try:
+            index = JobIndex(self.fetch(query))
+        except Exception as e:
+            print(f"[ERROR] Job feed fetch failed for '{query}': {e}")
+            with self._lock:
+                self.errors += 1
+                self._pending.pop(query, None)
+            raise
+        with self._lock:
+            self._entries[query] = (index, time.time())
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_queries:
+                self._entries.popitem(last=False)
+            self._pending.pop(query, None)
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'queries': len(self._entries),
+                'refreshing': len(self._pending),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'errors': self.errors
+            }
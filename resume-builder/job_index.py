@@ -0,0 +1,296 @@
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from render_cache import normalize_profile
+
+# Fields whose words are indexed for term search, and how much a word in each
+# counts towards its term frequency when jobs are ranked (a title match says
+# more about a job than a passing mention in its description)
+TEXT_FIELDS = {
+    'title': 3,
+    'company_name': 1,
+    'category': 2,
+    'candidate_required_location': 1,
+    'job_type': 1,
+    'description': 1
+}
+
+# Fields whose whole (lowercased) values are indexed for the filters below
+VALUE_FIELDS = ('candidate_required_location', 'job_type')
+
+# /job-search jobType filters, applied to Remotive's job_type values
+JOB_TYPE_FILTERS = {
+    'remote': lambda value: 'remote' in value,
+    'onsite': lambda value: 'remote' not in value,
+    'hybrid': lambda value: 'hybrid' in value
+}
+
+# How much each part of a profile counts in a /suggest-jobs query
+PROFILE_WEIGHTS = {
+    'skills': 2.0,
+    'titles': 1.5,
+    'headline': 1.0,
+    'summary': 0.5
+}
+
+# Filter postings kept per index before the memo is reset
+MAX_CACHED_FILTERS = 256
+
+TAG = re.compile(r'<[^>]+>')
+TOKEN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+def job_key(job):
+    """Stable identity of a posting: its feed id, else its URL"""
+    key = job.get('id') or job.get('url')
+    return None if key is None else str(key)
+
+def tokenize(text):
+    """Lowercase words of a text, with HTML tags removed"""
+    return TOKEN.findall(TAG.sub(' ', text or '').lower())
+
+def _as_list(value):
+    """List fields of a profile; a single string (e.g. "Python, Flask") is one item"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [value]
+    return []
+
+def profile_terms(profile_data):
+    """Weighted query terms for a flat or LinkedIn-style profile: every skill,
+    every experience title, the headline and the summary. Kept here rather than
+    in job_ranking so callers do not import NumPy just to build a query."""
+    profile = normalize_profile(profile_data)
+    parts = {
+        'skills': [str(skill) for skill in _as_list(profile.get('skills'))],
+        'titles': [
+            str(exp.get('title') or exp.get('position') or '')
+            for exp in _as_list(profile.get('experience')) if isinstance(exp, dict)
+        ],
+        'headline': [str(profile.get('headline') or '')],
+        'summary': [str(profile.get('summary') or '')]
+    }
+    terms = {}
+    for part, texts in parts.items():
+        for text in texts:
+            for word in tokenize(text):
+                terms[word] = terms.get(word, 0) + PROFILE_WEIGHTS[part]
+    return terms
+
+class JobIndex:
+    """Inverted index over job postings, kept up to date as postings come and go.
+
+    Jobs get increasing positions as they are added, so every posting list is
+    sorted. A query is an intersection of posting lists that walks the
+    shortest one from the newest job down and stops as soon as it has `limit`
+    matches. Filters on locations and job types match whole values by
+    substring, as /job-search always has; the few distinct values are
+    indexed, so a filter only tests each distinct value once.
+
+    Removing a job only marks its position; queries skip it, and once most
+    positions are dead the index is rebuilt from the live jobs. So adding or
+    removing a job costs about the size of that job, not of the index.
+
+    Every job also gets an increasing sequence number, which unlike its
+    position survives compaction; page() cursors are sequence numbers."""
+
+    def __init__(self, jobs=(), sequences=None):
+        self._lock = threading.RLock()
+        self._ranker = None
+        self._next_sequence = 0
+        self._reset()
+        # Feeds list the newest job first; it gets the highest position
+        for i in range(len(jobs) - 1, -1, -1):
+            self._add(jobs[i], None if sequences is None else sequences[i])
+
+    def _reset(self):
+        self.jobs = []  # by position; None once removed
+        self.sequences = array('Q')  # by position
+        self.positions = {}  # job key -> position
+        self.tokens = {}
+        # Weighted term frequencies, parallel to each posting list, and the
+        # weighted length of each job, for ranking
+        self.frequencies = {}
+        self.lengths = array('I')
+        self.values = {field: {} for field in VALUE_FIELDS}
+        self.live = 0
+        self.version = 0
+        # Postings of past filters; a feed sees the same few filters again and again
+        self._filters = {}
+
+    def __len__(self):
+        return self.live
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def add(self, job, sequence=None):
+        """Add a job as the newest, replacing the job with the same key if there
+        is one. sequence, if given, must be above every sequence so far."""
+        with self._lock:
+            self._remove(job_key(job))
+            self._add(job, sequence)
+            self._changed()
+
+    def remove(self, key):
+        with self._lock:
+            if self._remove(key):
+                self._changed()
+
+    def live_jobs(self):
+        """Live jobs, newest first"""
+        with self._lock:
+            return [job for job in reversed(self.jobs) if job is not None]
+
+    def search(self, terms=(), location=None, job_type=None, limit=None):
+        """Jobs, newest first, containing every term and matching the location
+        (substring) and job type (a JOB_TYPE_FILTERS key) if given"""
+        with self._lock:
+            positions = self._search(terms, location, job_type, limit)
+            return [self.jobs[position] for position in positions]
+
+    def page(self, limit, cursor=None, terms=(), location=None, job_type=None):
+        """Return (jobs, next_cursor) for search(). Jobs are newest first; pass
+        next_cursor back to get the following page, None means there are no
+        more jobs. Cursors stay valid as jobs are added and removed."""
+        with self._lock:
+            # One extra job tells whether another page exists
+            positions = self._search(terms, location, job_type, limit + 1, cursor)
+            next_cursor = None
+            if len(positions) > limit:
+                positions = positions[:limit]
+                next_cursor = str(self.sequences[positions[-1]])
+            return [self.jobs[position] for position in positions], next_cursor
+
+    def ranker(self):
+        """BM25 ranker over the live jobs, rebuilt on first use after a change"""
+        with self._lock:
+            if self._ranker is None or self._ranker.version != self.version:
+                # job_ranking builds on this module
+                from job_ranking import Bm25Ranker
+                self._ranker = Bm25Ranker(self)
+            return self._ranker
+
+    def rank(self, terms, limit=10):
+        """(job, BM25 score) of the live jobs best matching {term: weight}, best first"""
+        with self._lock:
+            return [(self.jobs[position], score) for position, score in self.ranker().top(terms, limit)]
+
+    def _search(self, terms, location, job_type, limit, cursor=None):
+        postings = []
+        for term in terms:
+            for word in tokenize(term):
+                postings.append(self.tokens.get(word, ()))
+        if location:
+            location = location.lower()
+            postings.append(self._filter('candidate_required_location', location, lambda value: location in value))
+        if job_type in JOB_TYPE_FILTERS:
+            postings.append(self._filter('job_type', job_type, JOB_TYPE_FILTERS[job_type]))
+        # Jobs older than the cursor are the ones below its position
+        below = None if cursor is None else bisect_left(self.sequences, int(cursor))
+        return intersect(postings, self.jobs, limit, below)
+
+    def _add(self, job, sequence=None):
+        position = len(self.jobs)
+        key = job_key(job)
+        if key is not None:
+            self.positions[key] = position
+        if sequence is None:
+            sequence = self._next_sequence
+        self._next_sequence = sequence + 1
+        self.jobs.append(job)
+        self.sequences.append(sequence)
+        self.live += 1
+
+        counts = Counter()
+        for field, weight in TEXT_FIELDS.items():
+            for word in tokenize(job.get(field)):
+                counts[word] += weight
+        for word, count in counts.items():
+            postings = self.tokens.get(word)
+            if postings is None:
+                postings = self.tokens[word] = array('I')
+                self.frequencies[word] = array('I')
+            postings.append(position)
+            self.frequencies[word].append(count)
+        self.lengths.append(sum(counts.values()))
+        for field in VALUE_FIELDS:
+            value = (job.get(field) or '').lower()
+            self.values[field].setdefault(value, array('I')).append(position)
+
+    def _remove(self, key):
+        position = self.positions.pop(key, None)
+        if position is None:
+            return False
+        self.jobs[position] = None
+        self.live -= 1
+        return True
+
+    def _changed(self):
+        self.version += 1
+        self._filters.clear()
+        if len(self.jobs) > 2 * self.live + 64:
+            self._compact()
+
+    def _compact(self):
+        # Rebuild from the live jobs, oldest first, so they keep their order
+        live = [(job, sequence) for job, sequence in zip(self.jobs, self.sequences) if job is not None]
+        version = self.version
+        next_sequence = self._next_sequence
+        self._reset()
+        self.version = version
+        for job, sequence in live:
+            self._add(job, sequence)
+        self._next_sequence = next_sequence
+
+    def _filter(self, field, key, matches):
+        postings = self._filters.get((field, key))
+        if postings is None:
+            positions = [
+                position
+                for value, value_postings in self.values[field].items() if matches(value)
+                for position in value_postings
+            ]
+            postings = array('I', sorted(positions))
+            if len(self._filters) >= MAX_CACHED_FILTERS:
+                self._filters.clear()
+            self._filters[(field, key)] = postings
+        return postings
+
+def intersect(postings, jobs, limit=None, below=None):
+    """Positions present in every sorted posting list whose job is still live,
+    highest (newest) first, starting under below and stopping after limit of
+    them. With no lists, every live position."""
+    found = []
+    if below is None:
+        below = len(jobs)
+    if not postings:
+        for position in range(min(below, len(jobs)) - 1, -1, -1):
+            if jobs[position] is not None:
+                found.append(position)
+                if len(found) == limit:
+                    break
+        return found
+
+    postings = sorted(postings, key=len)
+    shortest, others = postings[0], postings[1:]
+    # Exclusive upper bounds; positions only go down from here
+    cursors = [bisect_left(other, below) for other in others]
+    for offset in range(bisect_left(shortest, below) - 1, -1, -1):
+        position = shortest[offset]
+        for index, other in enumerate(others):
+            cursor = bisect_right(other, position, 0, cursors[index])
+            cursors[index] = cursor
+            if cursor == 0:
+                # Below the start of one list, so nothing further can match
+                return found
+            if other[cursor - 1] != position:
+                break
+        else:
+            if jobs[position] is not None:
+                found.append(position)
+                if len(found) == limit:
+                    break
+    return found
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+import traceback
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, and no multi-process servers to coordinate
+    fcntl = None
+
+class JobFeedIngester:
+    """Pulls the whole job feed every interval seconds in a daemon thread and
+    applies it to a JobStore, so the job endpoints never wait on the upstream
+    and it sees one request per interval however busy they are.
+
+    Every app process (e.g. each gunicorn worker) runs one, but only the
+    process holding an exclusive lock on lock_path fetches and writes; the
+    others refresh their index from the store's database every
+    refresh_interval seconds, and take over the lock if its holder exits.
+    A failed pull is retried after retry_delay seconds, doubling up to the
+    interval."""
+
+    def __init__(self, fetch, store, interval=600, retry_delay=15, refresh_interval=30, lock_path=None):
+        self.fetch = fetch
+        self.store = store
+        self.interval = interval
+        self.retry_delay = retry_delay
+        self.refresh_interval = refresh_interval
+        self.lock_path = lock_path or f'{store.path}.lock'
+
+        self.runs = 0
+        self.errors = 0
+        self.failures = 0
+        self.last_run = None
+        self.last_seconds = None
+        self.last_delta = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock_file = None
+        self.leader = False
+
+    def start(self):
+        """Ingest now, then every interval seconds, in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='job-feed-ingest', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self):
+        """Fetch the feed and apply its delta to the store"""
+        started = time.perf_counter()
+        feed = self.fetch('')
+        fetched = time.perf_counter()
+        delta = self.store.apply(feed)
+        finished = time.perf_counter()
+        delta['feed'] = len(feed)
+        delta['fetch_ms'] = round((fetched - started) * 1000, 2)
+        delta['apply_ms'] = round((finished - fetched) * 1000, 2)
+        with self._lock:
+            self.runs += 1
+            self.failures = 0
+            self.last_run = time.time()
+            self.last_seconds = round(finished - started, 4)
+            self.last_delta = delta
+        print(f"[DEBUG] Ingested job feed: {delta}")
+        return delta
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                'role': 'leader' if self.leader else 'follower',
+                'interval': self.interval,
+                'runs': self.runs,
+                'errors': self.errors,
+                'last_run': self.last_run,
+                'last_seconds': self.last_seconds,
+                'last_delta': self.last_delta
+            }
+        stats.update(self.store.stats())
+        return stats
+
+    def _acquire(self):
+        """Take the writer lock if no other process holds it"""
+        if self.leader:
+            return True
+        if fcntl is None:
+            self.leader = True
+            return True
+        lock_file = open(self.lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        self.leader = True
+        print(f"[DEBUG] Process {os.getpid()} ingests the job feed")
+        return True
+
+    def _run(self):
+        while True:
+            if self._acquire():
+                delay = self._ingest()
+            else:
+                delay = self._follow()
+            if self._stop.wait(delay):
+                break
+        # Hand the writer role to another process
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self.leader = False
+
+    def _ingest(self):
+        """One pull as the writer; returns the seconds until the next one"""
+        try:
+            # Catch up with whatever a previous writer applied, so the diff
+            # is taken against the database rather than a stale index
+            self.store.refresh()
+            self.run_once()
+            return self.interval
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.failures += 1
+                delay = min(self.interval, self.retry_delay * 2 ** (self.failures - 1))
+            print(f"[ERROR] Job feed ingest failed, retrying in {delay}s: {e}")
+            print(f"[ERROR] Traceback: {traceback.format_exc()}")
+            return delay
+
+    def _follow(self):
+        """Pick up the writer's changes; returns the seconds until the next check"""
+        try:
+            delta = self.store.refresh()
+            if delta is not None:
+                print(f"[DEBUG] Refreshed job store: {delta}")
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            print(f"[ERROR] Job store refresh failed: {e}")
+        return min(self.interval, self.refresh_interval)
@@ -0,0 +1,69 @@
+import numpy as np
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+class Bm25Ranker:
+    """BM25 scores of a JobIndex's jobs for weighted query terms.
+
+    Each term's posting list is turned into its BM25 contribution per job
+    once, when the ranker is built, and all of them are stored back to back
+    (CSR layout). Scoring a query then gathers the slices of its terms,
+    scales them by the query weights and sums them per job with one
+    bincount, so a query costs a few vector operations over the postings
+    it touches."""
+
+    def __init__(self, index):
+        # Caller holds the index's lock
+        self.version = index.version
+        self.size = len(index.jobs)
+        self.term_ids = {}
+        self.live = np.fromiter((job is not None for job in index.jobs), dtype=bool, count=self.size)
+        live_count = int(self.live.sum())
+        lengths = np.asarray(index.lengths, dtype=np.float64)
+        average_length = lengths[self.live].mean() if self.live.any() else 0.0
+        # Per-job part of BM25's denominator
+        norms = K1 * (1 - B + B * lengths / (average_length or 1.0))
+
+        offsets = [0]
+        for word, postings in index.tokens.items():
+            self.term_ids[word] = len(offsets) - 1
+            offsets.append(offsets[-1] + len(postings))
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.jobs = np.empty(offsets[-1], dtype=np.int32)
+        self.weights = np.empty(offsets[-1], dtype=np.float32)
+
+        for word, term_id in self.term_ids.items():
+            start, end = offsets[term_id], offsets[term_id + 1]
+            jobs = np.frombuffer(index.tokens[word], dtype=np.uint32)
+            frequencies = np.frombuffer(index.frequencies[word], dtype=np.uint32).astype(np.float64)
+            documents = np.count_nonzero(self.live[jobs])
+            idf = np.log(1 + (live_count - documents + 0.5) / (documents + 0.5))
+            self.jobs[start:end] = jobs
+            self.weights[start:end] = idf * frequencies * (K1 + 1) / (frequencies + norms[jobs])
+
+    def scores(self, terms):
+        """BM25 score of every job for a {term: weight} query"""
+        slices = []
+        weights = []
+        for word, weight in terms.items():
+            term_id = self.term_ids.get(word)
+            if term_id is not None:
+                start, end = self.offsets[term_id], self.offsets[term_id + 1]
+                slices.append(self.jobs[start:end])
+                weights.append(self.weights[start:end] * weight)
+        if not slices:
+            return np.zeros(self.size)
+        return np.bincount(np.concatenate(slices), weights=np.concatenate(weights), minlength=self.size)
+
+    def top(self, terms, limit=10):
+        """(job position, score) of the best matching live jobs, best first;
+        jobs sharing no term with the query are left out"""
+        scores = self.scores(terms)
+        matched = np.flatnonzero((scores > 0) & self.live)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        # Best first, newer (higher position) jobs first on ties
+        order = np.lexsort((-matched, -scores[matched]))
+        return [(int(matched[i]), float(scores[matched[i]])) for i in order]
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from job_index import JobIndex, job_key
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    data BLOB NOT NULL,
+    first_seen REAL NOT NULL,
+    updated REAL NOT NULL,
+    removed REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_live ON jobs (removed, seq);
+CREATE TABLE IF NOT EXISTS ingests (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    finished REAL NOT NULL
+);
+'''
+
+def job_hash(job):
+    """Content hash of a posting, to tell changed postings from unchanged ones"""
+    payload = json.dumps(job, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class JobStore:
+    """Local copy of the job feed: a SQLite table of postings (zlib-compressed
+    JSON) and an in-memory JobIndex over the live ones, which is what the job
+    endpoints search.
+
+    apply() takes a full feed and diffs it by job id against the content
+    hashes of the live postings. Only new and changed postings are written
+    and indexed; postings that left the feed are tombstoned (kept with a
+    removed time) and dropped from the index. Tombstones are purged after
+    tombstone_ttl seconds.
+
+    Only one process applies feeds (see JobFeedIngester); the others call
+    refresh() to catch their index up with what it wrote."""
+
+    def __init__(self, path, tombstone_ttl=7 * 24 * 3600):
+        self.path = path
+        self.tombstone_ttl = tombstone_ttl
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(SCHEMA)
+            rows = self._connection.execute(
+                'SELECT id, seq, content_hash, data FROM jobs WHERE removed IS NULL ORDER BY seq'
+            ).fetchall()
+            self._next_seq = self._connection.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs').fetchone()[0]
+            self.last_ingest = self._last_ingest()
+
+        # Live postings by id; rows come oldest first, the index wants newest first.
+        # Its sequences are the rows' seq, so search cursors survive restarts.
+        self._hashes = {key: digest for key, _, digest, _ in rows}
+        rows.reverse()
+        self.index = JobIndex(
+            [json.loads(zlib.decompress(data)) for _, _, _, data in rows],
+            [seq for _, seq, _, _ in rows]
+        )
+
+    @property
+    def ready(self):
+        """Whether a feed has been ingested, i.e. the index can be searched"""
+        return self.last_ingest is not None
+
+    def _last_ingest(self):
+        # Caller holds self._lock. Stores written before ingests were recorded
+        # count as ingested if they hold any postings.
+        row = self._connection.execute(
+            'SELECT COALESCE((SELECT finished FROM ingests), (SELECT MAX(updated) FROM jobs))'
+        ).fetchone()
+        return row[0]
+
+    def apply(self, feed):
+        """Bring the store in line with a full feed (newest first); returns the delta's counts"""
+        now = time.time()
+        seen = set()
+        changes = []
+        added = 0
+        for job in feed:
+            key = job_key(job)
+            if key is None or key in seen:
+                continue
+            seen.add(key)
+            digest = job_hash(job)
+            previous = self._hashes.get(key)
+            if previous != digest:
+                changes.append((key, job, digest))
+                added += previous is None
+        removed = [key for key in self._hashes if key not in seen]
+
+        with self._lock, self._connection:
+            # Oldest first, so sequence numbers follow the feed's order
+            rows = []
+            for key, job, digest in reversed(changes):
+                data = zlib.compress(json.dumps(job, separators=(',', ':')).encode('utf-8'))
+                rows.append((key, self._next_seq, digest, data, now, now))
+                self._next_seq += 1
+            if rows:
+                self._connection.executemany(
+                    'INSERT INTO jobs (id, seq, content_hash, data, first_seen, updated) VALUES (?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT (id) DO UPDATE SET seq = excluded.seq, content_hash = excluded.content_hash, '
+                    'data = excluded.data, updated = excluded.updated, removed = NULL',
+                    rows
+                )
+            if removed:
+                self._connection.executemany(
+                    'UPDATE jobs SET removed = ? WHERE id = ?', [(now, key) for key in removed]
+                )
+            purged = self._connection.execute(
+                'DELETE FROM jobs WHERE removed < ?', (now - self.tombstone_ttl,)
+            ).rowcount
+            self._connection.execute('INSERT OR REPLACE INTO ingests (id, finished) VALUES (1, ?)', (now,))
+
+        for key in removed:
+            del self._hashes[key]
+            self.index.remove(key)
+        for (key, job, digest), row in zip(reversed(changes), rows):
+            self._hashes[key] = digest
+            # Indexed under the row's seq
+            self.index.add(job, row[1])
+
+        self.last_ingest = now
+        return {
+            'added': added,
+            'updated': len(changes) - added,
+            'removed': len(removed),
+            'unchanged': len(seen) - len(changes),
+            'purged': purged
+        }
+
+    def refresh(self):
+        """Catch the index up with feeds another process applied to the
+        database since the last apply() or refresh(). Changed postings get new
+        sequence numbers, so they are the live rows above the last one seen.
+        Returns the numbers of postings added or updated and removed, or None
+        if nothing was ingested in the meantime."""
+        with self._lock:
+            last_ingest = self._last_ingest()
+            if last_ingest == self.last_ingest:
+                return None
+            live = {key for key, in self._connection.execute('SELECT id FROM jobs WHERE removed IS NULL')}
+            rows = self._connection.execute(
+                'SELECT id, seq, content_hash, data FROM jobs WHERE removed IS NULL AND seq >= ? ORDER BY seq',
+                (self._next_seq,)
+            ).fetchall()
+            self._next_seq = self._connection.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs').fetchone()[0]
+
+        removed = [key for key in self._hashes if key not in live]
+        for key in removed:
+            del self._hashes[key]
+            self.index.remove(key)
+        for key, seq, digest, data in rows:
+            self._hashes[key] = digest
+            self.index.add(json.loads(zlib.decompress(data)), seq)
+        self.last_ingest = last_ingest
+        return {'changed': len(rows), 'removed': len(removed)}
+
+    def stats(self):
+        with self._lock:
+            tombstones = self._connection.execute('SELECT COUNT(*) FROM jobs WHERE removed IS NOT NULL').fetchone()[0]
+        return {'jobs': len(self.index), 'tombstones': tombstones, 'last_ingest': self.last_ingest}
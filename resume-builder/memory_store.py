@@ -0,0 +1,56 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+class MemoryResumeStore:
+    """Bounded in-memory store with a TTL for rendered resumes that are only
+    downloaded once and never need to touch the filesystem"""
+
+    def __init__(self, max_items=200, max_bytes=64 * 1024 * 1024, ttl=300):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, filename, data, mimetype):
+        """Store rendered bytes and return the unique filename they are served under"""
+        stem, _, extension = filename.rpartition('.')
+        key = f"{stem}_{uuid.uuid4().hex[:8]}.{extension}"
+
+        with self._lock:
+            self._entries[key] = (data, mimetype, time.monotonic() + self.ttl)
+            self._total_bytes += len(data)
+            self._evict()
+        return key
+
+    def get(self, key):
+        """Return (data, mimetype) for a stored resume, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, mimetype, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            return data, mimetype
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key):
+        data, _, _ = self._entries.pop(key)
+        self._total_bytes -= len(data)
+
+    def _evict(self):
+        """Drop expired entries, then the oldest ones until within bounds"""
+        now = time.monotonic()
+        for key in [k for k, (_, _, expires_at) in self._entries.items() if expires_at < now]:
+            self._remove(key)
+
+        while self._entries and (len(self._entries) > self.max_items or self._total_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
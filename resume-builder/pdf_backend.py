@@ -0,0 +1,323 @@
+import copy
+import re
+import traceback
+from functools import partial
+from io import BytesIO
+from xml.sax.saxutils import escape
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.pdfdoc import PDFStream, PDFArray, PDFName, PDFZCompress, PDFBase85Encode
+from reportlab import rl_config
+from render_cache import FragmentCache
+from pdf_fit import TextMetrics, PageFitter, MIN_SCALE
+from config import Config
+
+# PDF templates; classic and minimal still share the modern layout
+PDF_TEMPLATES = ('modern', 'classic', 'minimal')
+
+# Page tree root of a reportlab PDF, which holds the document's page count
+PAGE_TREE = re.compile(rb'<<[^<>]*/Type /Pages[^<>]*>>')
+PAGE_COUNT = re.compile(rb'/Count (\d+)')
+
+class PdfBackend:
+    """Renders PDF resumes with reportlab, one pre-built flowable factory per template.
+    The factories share a cache of section fragments, so regenerating an edited
+    resume only builds and line-breaks the fragments that changed."""
+    
+    def __init__(self):
+        self.fragment_cache = FragmentCache(Config.FRAGMENT_CACHE_MAX_ITEMS)
+        self._factories = {
+            template: PdfFlowableFactory(template, self.fragment_cache) for template in PDF_TEMPLATES
+        }
+        
+        # Frame size of the page template, less the frame's 6pt padding on each side
+        frame = SimpleDocTemplate(BytesIO(), pagesize=letter)
+        self.fitter = PageFitter(TextMetrics(), frame.width - 12, frame.height - 12)
+    
+    def render(self, layout, template, filepath, fit_pages=None, stream=None, **options):
+        """Generate PDF resume from a resume layout. With fit_pages, fonts and
+        spacing shrink as little as needed to fit that many pages. Resumes with
+        PDF_STREAM_MIN_ENTRIES entries or more (or stream=True) are built from
+        a lazy flowable stream rather than a full story list."""
+        try:
+            if fit_pages:
+                self._render_fitted(layout, template, filepath, fit_pages)
+                return
+            
+            if stream is None:
+                stream = count_entries(layout) >= Config.PDF_STREAM_MIN_ENTRIES
+            
+            doc = SimpleDocTemplate(filepath, pagesize=letter)
+            if stream:
+                doc.build(FlowableStream(self._factories[template].iter_story(layout)),
+                          canvasmaker=StreamingCanvas)
+            else:
+                doc.build(self._factories[template].build_story(layout))
+            print(f"[DEBUG] PDF generated successfully: {filepath}")
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to generate PDF: {e}")
+            print(f"[ERROR] PDF Traceback: {traceback.format_exc()}")
+            raise
+    
+    def _render_fitted(self, layout, template, filepath, fit_pages):
+        """Pick the scale from estimated page counts, then confirm it with a real
+        build. If the estimate was optimistic, one more build at a smaller scale."""
+        items = self.fitter.measure(self._factories[template].build_story(layout))
+        scale, spacing = self.fitter.find_scale(items, fit_pages)
+        
+        for builds in (1, 2):
+            buffer = BytesIO()
+            doc = SimpleDocTemplate(buffer, pagesize=letter)
+            if scale == 1.0:
+                factory = self._factories[template]
+            else:
+                factory = PdfFlowableFactory(template, self.fragment_cache, scale, spacing)
+            doc.build(factory.build_story(layout))
+            if doc.page <= fit_pages or scale == MIN_SCALE:
+                break
+            scale = max(MIN_SCALE, round(scale * 0.95, 3))
+            spacing = scale * scale
+        
+        if doc.page > fit_pages:
+            print(f"[ERROR] PDF does not fit {fit_pages} pages even at scale {scale}: {doc.page} pages")
+        else:
+            print(f"[DEBUG] PDF fitted to {doc.page}/{fit_pages} pages at scale {scale} after {builds} builds")
+        if isinstance(filepath, str):
+            with open(filepath, 'wb') as f:
+                f.write(buffer.getvalue())
+        else:
+            filepath.write(buffer.getvalue())
+
+    def page_count(self, data):
+        """Number of pages of a PDF this backend rendered"""
+        match = PAGE_TREE.search(data)
+        if match is None:
+            raise ValueError("Not a PDF with a page tree")
+        return int(PAGE_COUNT.search(match.group(0)).group(1))
+
+def count_entries(layout):
+    """Number of positions and degrees in a layout"""
+    return sum(len(section.content) for section in layout.sections if section.kind == 'entries')
+
+class FlowableStream:
+    """List-like view of a flowable generator for doc.build().
+    
+    reportlab consumes the story from the front (del story[0]), splits by
+    putting the remainder back at the front and only looks a few flowables
+    ahead for keepWithNext. So this pulls flowables from the generator a few
+    at a time and holds just those, and a flowable is released as soon as it
+    has been drawn. len() is the number of buffered flowables, which stays
+    non-zero until the generator is exhausted."""
+    
+    def __init__(self, flowables, lookahead=16):
+        self._source = iter(flowables)
+        self._buffer = []
+        self.lookahead = lookahead
+    
+    def _fill(self, count):
+        while self._source is not None and len(self._buffer) < count:
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                self._source = None
+    
+    def _fill_for(self, index):
+        if isinstance(index, slice):
+            if index.stop is None or index.stop < 0 or (index.start or 0) < 0:
+                self._fill(float('inf'))
+            else:
+                self._fill(index.stop)
+        elif index < 0:
+            self._fill(float('inf'))
+        else:
+            self._fill(index + 1)
+    
+    def __len__(self):
+        self._fill(self.lookahead)
+        return len(self._buffer)
+    
+    def __bool__(self):
+        return len(self) > 0
+    
+    def __getitem__(self, index):
+        self._fill_for(index)
+        return self._buffer[index]
+    
+    def __setitem__(self, index, value):
+        self._fill_for(index)
+        self._buffer[index] = value
+    
+    def __delitem__(self, index):
+        self._fill_for(index)
+        del self._buffer[index]
+    
+    def insert(self, index, flowable):
+        self._buffer.insert(index, flowable)
+
+class StreamingCanvas(Canvas):
+    """Canvas that compresses each page's content stream as soon as the page
+    is finished. reportlab otherwise keeps the drawing operators of every
+    page as text until save(), which would make memory grow with the page
+    count. The PDF written is the same."""
+    
+    def showPage(self):
+        pages = self._doc.Pages.pages
+        Canvas.showPage(self)
+        page = pages[-1]
+        if page.compression and page.stream:
+            # Same filters PDFPage.check_format() would apply on save()
+            filters = [PDFBase85Encode, PDFZCompress] if rl_config.useA85 else [PDFZCompress]
+            content = page.stream
+            for stream_filter in reversed(filters):
+                content = stream_filter.encode(content)
+            contents = PDFStream(content=content)
+            # With a Filter already set, the content is written as is
+            contents.dictionary['Filter'] = PDFArray([PDFName(f.pdfname) for f in filters])
+            contents.__Comment__ = 'page stream'
+            page.Contents = contents
+            page.stream = None
+
+class FragmentParagraph(Paragraph):
+    """Paragraph that remembers its line breaks per width. Copies made with
+    copy.copy() share them, so a cached fragment placed in a new story is
+    only broken into lines again when the column width changes."""
+    
+    def __init__(self, *args, **kwargs):
+        Paragraph.__init__(self, *args, **kwargs)
+        self._line_breaks = {}
+    
+    def breakLines(self, width):
+        key = tuple(width) if isinstance(width, (list, tuple)) else width
+        lines = self._line_breaks.get(key)
+        if lines is None:
+            lines = self._line_breaks[key] = Paragraph.breakLines(self, width)
+        return lines
+
+class PdfFlowableFactory:
+    """Turns a resume layout into the PDF story of one template. Styles are
+    built once when the factory is created, so each render only creates
+    flowables. With a fragment cache, flowables are built once per fragment
+    and each story gets its own copies, since reportlab keeps layout state
+    on them. scale multiplies font sizes and leading, spacing multiplies
+    spacers and the space around paragraphs."""
+    
+    def __init__(self, template, fragment_cache=None, scale=1.0, spacing=1.0):
+        self.template = template
+        self.fragment_cache = fragment_cache
+        self.scale = round(scale, 3)
+        self.spacing = round(spacing, 3)
+        styles = getSampleStyleSheet()
+        
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            textColor=colors.darkblue
+        )
+        
+        self.subtitle_style = ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=14,
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        )
+        
+        self.section_style = ParagraphStyle(
+            'SectionHeader',
+            parent=styles['Heading2'],
+            fontSize=16,
+            spaceAfter=6,
+            textColor=colors.darkblue
+        )
+        
+        self.body_style = styles['Normal']
+        
+        if (self.scale, self.spacing) != (1.0, 1.0):
+            self.title_style, self.subtitle_style, self.section_style, self.body_style = [
+                self._scaled(style)
+                for style in (self.title_style, self.subtitle_style, self.section_style, self.body_style)
+            ]
+    
+    def _scaled(self, style):
+        return ParagraphStyle(
+            style.name,
+            parent=style,
+            fontSize=style.fontSize * self.scale,
+            leading=style.leading * self.scale,
+            spaceBefore=style.spaceBefore * self.spacing,
+            spaceAfter=style.spaceAfter * self.spacing
+        )
+    
+    def build_story(self, layout):
+        """Build the list of flowables for a resume layout. Text is escaped,
+        since Paragraph treats it as markup."""
+        story = []
+        for key, flowables in self._fragments(layout):
+            if self.fragment_cache is None:
+                story.extend(flowables())
+            else:
+                fragment = self.fragment_cache.get_or_render((self.template, self.scale, self.spacing, key), flowables)
+                story.extend(copy.copy(flowable) for flowable in fragment)
+        return story
+    
+    def iter_story(self, layout):
+        """Yield the story's flowables one fragment at a time. Nothing is kept
+        or cached, so memory does not grow with the size of the layout."""
+        for _, flowables in self._fragments(layout):
+            yield from flowables()
+    
+    def _fragments(self, layout):
+        """Yield (fragment key, function returning the fragment's flowables) for
+        the header, each section heading, each entry and each other section body"""
+        yield ('header', layout.name, layout.headline, layout.contact), partial(self._header, layout)
+        for section in layout.sections:
+            yield ('heading', section.title), partial(self._heading, section.title)
+            if section.kind == 'entries':
+                for entry in section.content:
+                    yield ('entry', entry), partial(self._entry, entry)
+                yield ('gap',), self._gap
+            else:
+                yield ('body', section), partial(self._body, section)
+    
+    def _header(self, layout):
+        flowables = [FragmentParagraph(escape(layout.name), self.title_style)]
+        if layout.headline:
+            flowables.append(FragmentParagraph(escape(layout.headline), self.subtitle_style))
+        
+        # Contact info
+        flowables.append(FragmentParagraph(escape(' | '.join(layout.contact)), self.subtitle_style))
+        flowables.append(Spacer(1, 12 * self.spacing))
+        return flowables
+    
+    def _heading(self, title):
+        return [FragmentParagraph(escape(title), self.section_style)]
+    
+    def _entry(self, entry):
+        header = f"<b>{escape(entry.title)}</b> - {escape(entry.organization)} ({escape(entry.dates)})"
+        flowables = [FragmentParagraph(header, self.body_style)]
+        if entry.details:
+            flowables.append(FragmentParagraph(escape(' | '.join(entry.details)), self.body_style))
+        if entry.description:
+            flowables.append(FragmentParagraph(escape(entry.description), self.body_style))
+        flowables.append(Spacer(1, 6 * self.spacing))
+        return flowables
+    
+    def _body(self, section):
+        if section.kind == 'list':
+            flowables = [FragmentParagraph(escape(", ".join(section.content)), self.body_style)]
+        else:
+            flowables = [FragmentParagraph(escape(text), self.body_style) for text in section.content]
+        flowables.append(Spacer(1, 12 * self.spacing))
+        return flowables
+    
+    def _gap(self):
+        return [Spacer(1, 12 * self.spacing)]
@@ -0,0 +1,144 @@
+import threading
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Paragraph, Spacer
+
+# Lower bounds for fit-to-pages: fonts shrink at most to this fraction of their
+# size, spacing (spacers and space before/after) shrinks as the square of it
+MIN_SCALE = 0.6
+
+# Binary search stops once the scale is known this precisely
+SCALE_PRECISION = 0.005
+
+class TextMetrics:
+    """Word widths at font size 1, cached per font. Widths grow linearly with
+    the font size, so one lookup serves every scale the search tries."""
+
+    def __init__(self, max_words=100000):
+        self.max_words = max_words
+        self._widths = {}
+        self._lock = threading.Lock()
+
+    def width(self, word, font):
+        key = (font, word)
+        width = self._widths.get(key)
+        if width is None:
+            width = stringWidth(word, font, 1)
+            with self._lock:
+                if len(self._widths) >= self.max_words:
+                    self._widths.clear()
+                self._widths[key] = width
+        return width
+
+class PageFitter:
+    """Estimates how many pages a story takes at a given scale without building
+    it, and searches for the largest scale that fits a page budget.
+
+    The story is measured once: each paragraph becomes its words' widths at
+    size 1 plus its style's size, leading and spacing. Every estimate then
+    re-wraps those widths greedily and places the lines on pages the way
+    reportlab's frames do (space after collapses into the next space before,
+    paragraphs split between lines, no single-line orphans)."""
+
+    def __init__(self, metrics, frame_width, frame_height):
+        self.metrics = metrics
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+
+    def measure(self, story):
+        """Turn a story built at scale 1 into the items estimate_pages() lays out"""
+        items = []
+        for flowable in story:
+            if isinstance(flowable, Paragraph):
+                style = flowable.style
+                words = []
+                for frag in flowable.frags:
+                    space = self.metrics.width(' ', frag.fontName)
+                    words.extend(
+                        (self.metrics.width(word, frag.fontName), space)
+                        for word in frag.text.split()
+                    )
+                items.append(('paragraph', words, style.fontSize, style.leading,
+                              style.spaceBefore, style.spaceAfter))
+            elif isinstance(flowable, Spacer):
+                items.append(('spacer', flowable.height))
+        return items
+
+    def estimate_pages(self, items, scale, spacing):
+        """Pages the measured story needs with fonts times scale and spacing times spacing"""
+        pages = 1
+        used = 0
+        previous_after = 0
+        at_top = True
+        for item in items:
+            if item[0] == 'spacer':
+                height = item[1] * spacing
+                if not at_top and used + height > self.frame_height:
+                    pages += 1
+                    used = 0
+                used += height
+                previous_after = 0
+                at_top = False
+                continue
+
+            _, words, font_size, leading, before, after = item
+            size = font_size * scale
+            leading *= scale
+            lines = self._count_lines(words, size)
+            before = 0 if at_top else max(before * spacing - previous_after, 0)
+
+            while True:
+                room = self.frame_height - used - before
+                if lines * leading <= room:
+                    used += before + lines * leading
+                    break
+                fitting = int(room / leading)
+                if fitting <= 1:
+                    if at_top:
+                        # Taller than an empty page; reportlab would split it anyway
+                        fitting = max(fitting, 1)
+                    else:
+                        pages += 1
+                        used = before = 0
+                        at_top = True
+                        continue
+                lines -= fitting
+                pages += 1
+                used = before = 0
+                at_top = True
+
+            previous_after = after * spacing
+            used += previous_after
+            at_top = False
+        return pages
+
+    def find_scale(self, items, pages):
+        """Largest scale (and its spacing) whose estimate fits in `pages`, or the
+        minimum scale if nothing does"""
+        if self.estimate_pages(items, 1.0, 1.0) <= pages:
+            return 1.0, 1.0
+        low, high = MIN_SCALE, 1.0
+        if self.estimate_pages(items, low, low * low) > pages:
+            return low, low * low
+        while high - low > SCALE_PRECISION:
+            middle = (low + high) / 2
+            if self.estimate_pages(items, middle, middle * middle) <= pages:
+                low = middle
+            else:
+                high = middle
+        return low, low * low
+
+    def _count_lines(self, words, size):
+        if not words:
+            return 1
+        width_limit = self.frame_width / size
+        lines = 1
+        line_width = 0
+        for width, space in words:
+            if line_width == 0:
+                line_width = width
+            elif line_width + space + width <= width_limit:
+                line_width += space + width
+            else:
+                lines += 1
+                line_width = width
+        return lines
@@ -0,0 +1,67 @@
+import hashlib
+from html import escape
+from text_backend import TextBackend, meta_line
+
+# Preview formats served by /preview-resume
+PREVIEW_FORMATS = ('html', 'text')
+
+# Sections shown one item per line, as the editor's list classes
+LIST_CLASSES = {
+    'certifications': ('certifications-list', 'certification-item'),
+    'achievements': ('achievements-list', 'achievement-item')
+}
+
+# Text previews are the txt download format
+_text_backend = TextBackend()
+
+def render_preview(layout, format='html'):
+    """Render a resume layout as an HTML fragment or plain text. This is plain
+    string building, so it takes microseconds and suits per-keystroke previews."""
+    if format == 'text':
+        return _render_text(layout)
+    return _render_html(layout)
+
+def preview_hash(content):
+    """Short content hash the client sends back to skip unchanged previews"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+def _render_html(layout):
+    # Same markup and classes as the editor's client-side preview
+    html = [f'<h1>{escape(layout.name)}</h1>', '<div class="contact-info">']
+    for value in (layout.headline,) + layout.contact:
+        if value:
+            html.append(f'<div>{escape(value)}</div>')
+    html.append('</div>')
+
+    for section in layout.sections:
+        if section.key == 'summary':
+            html.extend(f'<div class="summary"><p>{escape(text)}</p></div>' for text in section.content)
+            continue
+        html.append(f'<h2>{escape(section.title)}</h2>')
+        if section.kind == 'entries':
+            item_class = 'education' if section.key == 'education' else 'experience'
+            for entry in section.content:
+                dates = meta_line(entry)
+                html.append(f'<div class="{item_class}-item">')
+                html.append(f'<h3 class="{item_class}-title">{escape(entry.title)}</h3>')
+                organization_class = 'education-school' if item_class == 'education' else 'experience-company'
+                html.append(f'<div class="{organization_class}">{escape(entry.organization)}</div>')
+                html.append(f'<div class="{item_class}-duration">{escape(dates)}</div>')
+                if entry.description:
+                    html.append(f'<p>{escape(entry.description)}</p>')
+                html.append('</div>')
+        elif section.kind == 'list':
+            html.append('<div class="skills-list">')
+            html.extend(f'<span class="skill-tag">{escape(item)}</span>' for item in section.content)
+            html.append('</div>')
+        elif section.key in LIST_CLASSES:
+            list_class, item_class = LIST_CLASSES[section.key]
+            html.append(f'<div class="{list_class}">')
+            html.extend(f'<div class="{item_class}">{escape(item)}</div>' for item in section.content)
+            html.append('</div>')
+        else:
+            html.extend(f'<p>{escape(text)}</p>' for text in section.content)
+    return ''.join(html)
+
+def _render_text(layout):
+    return ''.join(_text_backend.iter_chunks(layout))
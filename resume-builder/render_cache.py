@@ -0,0 +1,111 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Bump whenever template output changes so stale cached renders are not served
+CACHE_VERSION = 3
+
+def normalize_profile(profile_data):
+    """Flatten personal_info so LinkedIn-style and flat profiles hash the same"""
+    profile = {key: value for key, value in profile_data.items() if key != 'personal_info'}
+    profile.update(profile_data.get('personal_info') or {})
+    return profile
+
+def cache_key(profile_data, template, format, options=None):
+    """Stable content hash of a normalized profile, template, format and any
+    render options that change the output"""
+    payload = {
+        'version': CACHE_VERSION,
+        'profile': normalize_profile(profile_data),
+        'template': template,
+        'format': format
+    }
+    if options:
+        payload['options'] = options
+    payload = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class RenderCache:
+    """Two-tier cache of rendered resumes: an in-memory LRU of bytes in front of
+    content-addressed files in resume storage, whose retention and eviction
+    are handled by the storage manager"""
+
+    def __init__(self, storage_manager, max_memory_items=128, max_memory_bytes=32 * 1024 * 1024):
+        self.storage_manager = storage_manager
+        self.max_memory_items = max_memory_items
+        self.max_memory_bytes = max_memory_bytes
+
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def filename_for(self, key, template, format):
+        """Name of the disk tier file for a cache key"""
+        return f'resume_{template}_{key[:16]}.{format}'
+
+    def get_memory(self, key):
+        """Return cached bytes for a key, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
+
+    def put_memory(self, key, data):
+        with self._lock:
+            if key in self._memory:
+                self._memory_bytes -= len(self._memory.pop(key))
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+
+            while len(self._memory) > self.max_memory_items or self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def has_file(self, filename):
+        """Check the disk tier for a file and mark it as recently used"""
+        return self.storage_manager.contains(filename)
+
+    def put_file(self, filename, size, owner=None):
+        """Register a file written to the disk tier"""
+        self.storage_manager.add(filename, size, owner)
+
+class FragmentCache:
+    """Bounded LRU of rendered resume fragments (a header, a section heading or
+    body, one entry). Keys contain the layout node itself, so a fragment is
+    found again whenever its content is unchanged, wherever it appears."""
+
+    def __init__(self, max_items=2048):
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render):
+        """Return the cached fragment for key, calling render() on a miss"""
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+
+        # Rendered outside the lock; a concurrent miss on the same key just renders twice
+        fragment = render()
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_items:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'fragments': len(self._fragments), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,175 @@
+import itertools
+import queue
+import threading
+import time
+import traceback
+import uuid
+from resume_layout import build_layout
+
+# Job priorities, lower runs first
+PRIORITIES = {'high': 0, 'normal': 1, 'low': 2}
+
+# Statuses after which a job never changes again
+FINISHED = ('done', 'failed')
+
+class QueueFull(Exception):
+    """Raised when the render queue already holds max_depth waiting jobs"""
+
+class RenderQueue:
+    """In-process queue of render jobs with a bounded pool of worker threads.
+
+    submit() returns at once with a job id. Workers take jobs by priority (then
+    in submission order) and render each format from one shared layout,
+    publishing every status change so callers can poll status() or block in
+    wait() for the next change. Once max_depth jobs are waiting, submit()
+    raises QueueFull instead of letting the backlog grow. Finished jobs are
+    kept for job_ttl seconds."""
+
+    def __init__(self, generator, workers=2, max_depth=100, job_ttl=600):
+        self.generator = generator
+        self.workers = workers
+        self.max_depth = max_depth
+        self.job_ttl = job_ttl
+
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs = {}
+        self._queued = 0
+        self._running = 0
+        self.completed = 0
+        self.failed = 0
+        # Guards the job table and is notified on every job update
+        self._changed = threading.Condition()
+        self._threads = []
+
+    def start(self):
+        """Start the worker threads"""
+        if not self._threads:
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'render-queue-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, profile_data, template='modern', formats=('docx',), docx_writer='python-docx',
+               owner=None, priority='normal', fit_pages=None):
+        """Queue a render and return the job's status"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        for format in formats:
+            self.generator._validate_request(template, format, docx_writer)
+
+        job_id = uuid.uuid4().hex
+        with self._changed:
+            self._prune()
+            if self._queued >= self.max_depth:
+                raise QueueFull(f"Render queue is full ({self._queued} jobs waiting)")
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'status': 'queued',
+                'priority': priority,
+                'template': template,
+                'formats': list(formats),
+                'filenames': {},
+                'fit': None,
+                'error': None,
+                'created': time.time(),
+                'started': None,
+                'finished': None,
+                'version': 0,
+                # Private to the queue, never returned by status()
+                'owner': owner,
+                'request': (profile_data, docx_writer, fit_pages)
+            }
+            self._queued += 1
+            self._queue.put((PRIORITIES[priority], next(self._sequence), job_id))
+            return self._public(self._jobs[job_id])
+
+    def status(self, job_id, owner=None):
+        """Current status of a job, or None if it is unknown or belongs to someone else"""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is None or job['owner'] != owner:
+                return None
+            return self._public(job)
+
+    def wait(self, job_id, version, owner=None, timeout=15):
+        """Block until the job's version differs from `version` or the timeout
+        passes, then return its status (None if the job is gone)"""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id]['version'] != version,
+                timeout
+            )
+            job = self._jobs.get(job_id)
+            if job is None or job['owner'] != owner:
+                return None
+            return self._public(job)
+
+    def stats(self):
+        with self._changed:
+            return {
+                'queued': self._queued,
+                'running': self._running,
+                'workers': self.workers,
+                'max_depth': self.max_depth,
+                'completed': self.completed,
+                'failed': self.failed
+            }
+
+    def _work(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            with self._changed:
+                job = self._jobs[job_id]
+                profile_data, docx_writer, fit_pages = job.pop('request')
+                self._queued -= 1
+                self._running += 1
+                self._update(job, status='running', started=time.time())
+
+            try:
+                layout = build_layout(profile_data)
+                for format in job['formats']:
+                    filename = self.generator.generate_resume(
+                        profile_data, job['template'], format, docx_writer, job['owner'], layout, fit_pages
+                    )
+                    changes = {'filenames': dict(job['filenames'], **{format: filename})}
+                    if fit_pages and format == 'pdf':
+                        changes['fit'] = self.generator.fit_report(fit_pages, filename)
+                    with self._changed:
+                        self._update(job, **changes)
+                status, error = 'done', None
+            except Exception as e:
+                print(f"[ERROR] Render job {job_id} failed: {e}")
+                print(f"[ERROR] Traceback: {traceback.format_exc()}")
+                status, error = 'failed', str(e)
+
+            with self._changed:
+                self._running -= 1
+                if status == 'done':
+                    self.completed += 1
+                else:
+                    self.failed += 1
+                self._update(job, status=status, error=error, finished=time.time())
+
+    def _update(self, job, **changes):
+        # Caller holds self._changed
+        job.update(changes)
+        job['version'] += 1
+        self._changed.notify_all()
+
+    def _prune(self):
+        # Caller holds self._changed
+        cutoff = time.time() - self.job_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['status'] in FINISHED and job['finished'] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if expired:
+            self._changed.notify_all()
+
+    def _public(self, job):
+        public = {key: value for key, value in job.items() if key not in ('owner', 'request')}
+        public['queue_depth'] = self._queued
+        return public
@@ -1,61 +1,100 @@
+import multiprocessing
 import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
 from datetime import datetime
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import traceback
+from config import Config
+from render_cache import RenderCache, cache_key
+from resume_storage import ResumeStorage, file_signature
+from storage_manager import StorageManager
+from resume_index import ResumeIndex
+from resume_layout import build_layout
+from format_backends import get_backend, MIME_TYPES, DOCX_WRITERS
+
+# Batch workers start as fresh interpreters rather than forks of the app: a fork
+# taken while one of the app's threads holds a lock (e.g. the backend registry's)
+# leaves that lock held forever in the worker
+BATCH_START_METHOD = 'spawn'
 
 class ResumeGenerator:
-    def __init__(self):
-        self.templates = {
-            'modern': self._generate_modern_resume,
-            'classic': self._generate_classic_resume,
-            'minimal': self._generate_minimal_resume
-        }
+    # Process pool for batch renders, created on first use
+    _batch_pool = None
+    _batch_pool_lock = threading.Lock()
+    
+    # Threads rendering the extra formats of a multi-format request
+    _render_pool = None
+
+    def __init__(self, retention=True):
+        self.templates = list(Config.AVAILABLE_TEMPLATES)
         
-        # Create generated_resumes directory if it doesn't exist
+        # Sharded, atomically written files under generated_resumes/
         self.output_dir = 'generated_resumes'
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        self.storage = ResumeStorage(self.output_dir)
+        self.storage.remove_stale_temp_files()
+        
+        # Retention, quotas and eviction; the eviction thread is started by the app.
+        # Without retention (batch workers) files are tracked but never evicted,
+        # and the parent process records them in the listing index.
+        if retention:
+            self.index = ResumeIndex(Config.RESUME_INDEX_PATH)
+            if self.index.is_new:
+                print(f"[DEBUG] Indexed {self.index.backfill(self.storage)} existing resumes")
+            self.storage_manager = StorageManager(
+                self.storage,
+                Config.STORAGE_MAX_AGE,
+                Config.STORAGE_MAX_BYTES,
+                Config.STORAGE_USER_QUOTA_BYTES,
+                Config.STORAGE_EVICTION_INTERVAL,
+                owners=self.index.owners()
+            )
+            self.storage_manager.on_remove(lambda filename, reason: self.index.remove(filename))
+            self.storage_manager.on_release(self.index.release)
+        else:
+            self.index = None
+            self.storage_manager = StorageManager(self.storage)
+        
+        # Repeated renders of the same profile, template and format are a lookup
+        self.render_cache = RenderCache(
+            self.storage_manager,
+            Config.RENDER_CACHE_MAX_ITEMS,
+            Config.RENDER_CACHE_MAX_MEMORY_BYTES
+        )
+    
+    def warm_up(self, formats=None):
+        """Load format backends ahead of the first request (all formats by default).
+        Otherwise each backend is imported and warmed up on first use."""
+        for format in formats or MIME_TYPES:
+            get_backend(format)
     
-    def generate_resume(self, profile_data, template='modern', format='docx'):
-        """Generate resume in specified format"""
+    def generate_resume(self, profile_data, template='modern', format='docx', docx_writer='python-docx', owner=None, layout=None, fit_pages=None):
+        """Generate resume in specified format. Stored files count against the owner's quota.
+        Pass a layout already built from profile_data to skip laying it out again.
+        fit_pages shrinks a PDF to that many pages; other formats ignore it."""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._validate_request(template, format, docx_writer)
+            options = self._render_options(format, fit_pages)
+            key = cache_key(profile_data, template, format, options)
+            filename = self.render_cache.filename_for(key, template, format)
+            filepath = self.storage.path_for(filename)
             
-            if format == 'docx':
-                filename = f'resume_{template}_{timestamp}.docx'
-                filepath = os.path.join(self.output_dir, filename)
-                
-                print(f"[DEBUG] Generating DOCX resume: {filepath}")
-                print(f"[DEBUG] Profile data keys: {list(profile_data.keys())}")
-                
-                if template in self.templates:
-                    self.templates[template](profile_data, filepath)
-                else:
-                    print(f"[ERROR] Unknown template: {template}")
-                    raise ValueError(f"Unknown template: {template}")
-                    
-            elif format == 'pdf':
-                filename = f'resume_{template}_{timestamp}.pdf'
-                filepath = os.path.join(self.output_dir, filename)
-                
-                print(f"[DEBUG] Generating PDF resume: {filepath}")
-                
-                if template in self.templates:
-                    self._generate_pdf_resume(profile_data, filepath, template)
-                else:
-                    print(f"[ERROR] Unknown template: {template}")
-                    raise ValueError(f"Unknown template: {template}")
-            else:
-                raise ValueError(f"Unsupported format: {format}")
+            # Identical profile, template and format were rendered before; the file
+            # is handed to this owner too, and counts against their quota
+            if self.render_cache.has_file(filename):
+                print(f"[DEBUG] Render cache hit: {filepath}")
+                self._record_file(filename, os.path.getsize(filepath), owner, template, format, key)
+                return filename
+            
+            print(f"[DEBUG] Generating {format.upper()} resume: {filepath}")
+            print(f"[DEBUG] Profile data keys: {list(profile_data.keys())}")
+            
+            data = self._get_rendered(profile_data, template, format, key, docx_writer, layout, options)
+            digest = self.storage.write(filename, data)
+            self._record_file(filename, len(data), owner, template, format, key, digest)
             
             # Verify file was created
             if os.path.exists(filepath):
@@ -71,259 +110,201 @@ class ResumeGenerator:
             print(f"[ERROR] Traceback: {traceback.format_exc()}")
             raise
     
-    def _get_field(self, profile_data, key):
-        if 'personal_info' in profile_data and key in profile_data['personal_info']:
-            return profile_data['personal_info'][key]
-        return profile_data.get(key, '')
-
-    def _generate_modern_resume(self, profile_data, filepath):
-        """Generate modern style resume"""
-        doc = Document()
-        
-        # Set page margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.5)
-            section.bottom_margin = Inches(0.5)
-            section.left_margin = Inches(0.75)
-            section.right_margin = Inches(0.75)
-        
-        # Header with name and contact info
-        header = doc.add_paragraph()
-        header.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    def generate_resumes(self, profile_data, template='modern', formats=('docx', 'pdf'), docx_writer='python-docx', owner=None, fit_pages=None):
+        """Generate the same resume in several formats from one layout. The first
+        format renders in this thread while the others render concurrently on the
+        render pool. Returns {format: filename}."""
+        for format in formats:
+            self._validate_request(template, format, docx_writer)
+        layout = build_layout(profile_data)
         
-        # Name
-        name = self._get_field(profile_data, 'name')
-        name_run = header.add_run(name)
-        name_run.font.size = Pt(24)
-        name_run.font.bold = True
-        name_run.font.name = 'Calibri'
-        
-        # Headline
-        doc.add_paragraph()
-        headline = self._get_field(profile_data, 'headline')
-        headline_para = doc.add_paragraph(headline)
-        headline_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        if headline_para.runs:
-            headline_para.runs[0].font.size = Pt(14)
-            headline_para.runs[0].font.italic = True
-            headline_para.runs[0].font.name = 'Calibri'
+        pool = self._get_render_pool()
+        futures = {
+            format: pool.submit(self.generate_resume, profile_data, template, format, docx_writer, owner, layout, fit_pages)
+            for format in formats[1:]
+        }
+        filenames = {formats[0]: self.generate_resume(profile_data, template, formats[0], docx_writer, owner, layout, fit_pages)}
+        for format, future in futures.items():
+            filenames[format] = future.result()
+        return filenames
+    
+    def render_resume(self, profile_data, template='modern', format='docx', docx_writer='python-docx', fit_pages=None):
+        """Render resume into an in-memory buffer, returns (filename, buffer)"""
+        try:
+            self._validate_request(template, format, docx_writer)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'resume_{template}_{timestamp}.{format}'
+            print(f"[DEBUG] Rendering {format.upper()} resume in memory: {filename}")
+            
+            options = self._render_options(format, fit_pages)
+            key = cache_key(profile_data, template, format, options)
+            data = self._get_rendered(profile_data, template, format, key, docx_writer, options=options)
+            return filename, BytesIO(data)
         
-        # Contact information
-        email = self._get_field(profile_data, 'email')
-        phone = self._get_field(profile_data, 'phone')
-        location = self._get_field(profile_data, 'location')
-        contact_info = doc.add_paragraph()
-        contact_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        contact_info.add_run(f"{email} | {phone} | {location}")
-        if contact_info.runs:
-            contact_info.runs[0].font.size = Pt(10)
-            contact_info.runs[0].font.name = 'Calibri'
+        except Exception as e:
+            print(f"[ERROR] Failed to render resume: {e}")
+            print(f"[ERROR] Traceback: {traceback.format_exc()}")
+            raise
+    
+    def generate_batch(self, profiles, templates=('modern',), formats=('docx',), owner=None):
+        """Render every profile x template x format over a process pool and
+        return a job summary with per-item filenames and timings"""
+        for template in templates:
+            for format in formats:
+                self._validate_request(template, format)
         
-        doc.add_paragraph()  # Spacing
+        items = [
+            (profile_index, profile_data, template, format)
+            for profile_index, profile_data in enumerate(profiles)
+            for template in templates
+            for format in formats
+        ]
+        job_id = uuid.uuid4().hex
+        started = time.perf_counter()
+        print(f"[DEBUG] Batch {job_id}: rendering {len(items)} resumes")
         
-        # Summary
-        summary = self._get_field(profile_data, 'summary')
-        if summary:
-            self._add_section_header(doc, "PROFESSIONAL SUMMARY")
-            summary_para = doc.add_paragraph(summary)
-            if summary_para.runs:
-                summary_para.runs[0].font.size = Pt(11)
-                summary_para.runs[0].font.name = 'Calibri'
-            doc.add_paragraph()  # Spacing
+        pool = self._get_batch_pool()
+        try:
+            futures = [pool.submit(_render_batch_item, index, *item) for index, item in enumerate(items)]
+            results = [future.result() for future in futures]
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next batch starts a fresh one
+            with self._batch_pool_lock:
+                ResumeGenerator._batch_pool = None
+            raise
         
-        # Experience
-        experience = profile_data.get('experience', [])
-        if experience:
-            self._add_section_header(doc, "PROFESSIONAL EXPERIENCE")
-            for exp in experience:
-                # Job title and company
-                job_header = doc.add_paragraph()
-                job_title = job_header.add_run(f"{exp.get('title', '')} - {exp.get('company', '')}")
-                job_title.font.bold = True
-                job_title.font.size = Pt(12)
-                job_title.font.name = 'Calibri'
-                
-                # Duration and location
-                duration_location = doc.add_paragraph()
-                duration_location.add_run(f"{exp.get('duration', '')} | {exp.get('location', '')}")
-                if duration_location.runs:
-                    duration_location.runs[0].font.italic = True
-                    duration_location.runs[0].font.size = Pt(10)
-                    duration_location.runs[0].font.name = 'Calibri'
-                
-                # Description
-                description = exp.get('description', '')
-                if description:
-                    description_para = doc.add_paragraph(description)
-                    if description_para.runs:
-                        description_para.runs[0].font.size = Pt(11)
-                        description_para.runs[0].font.name = 'Calibri'
-                doc.add_paragraph()  # Spacing
+        # Workers wrote the files, so make them known to this process's cache and index
+        for item in results:
+            if item['filename']:
+                filepath = self.storage.path_for(item['filename'])
+                key = cache_key(profiles[item['profile_index']], item['template'], item['format'])
+                self._record_file(item['filename'], os.path.getsize(filepath), owner, item['template'], item['format'], key)
         
-        # Education
-        education = profile_data.get('education', [])
-        if education:
-            self._add_section_header(doc, "EDUCATION")
-            for edu in education:
-                # Degree and school
-                edu_header = doc.add_paragraph()
-                degree_school = edu_header.add_run(f"{edu.get('degree', '')} - {edu.get('school', '')}")
-                degree_school.font.bold = True
-                degree_school.font.size = Pt(12)
-                degree_school.font.name = 'Calibri'
-                
-                # Duration and GPA
-                edu_details = doc.add_paragraph()
-                details_text = f"{edu.get('duration', '')} | {edu.get('location', '')}"
-                if edu.get('gpa'):
-                    details_text += f" | GPA: {edu['gpa']}"
-                edu_details.add_run(details_text)
-                if edu_details.runs:
-                    edu_details.runs[0].font.italic = True
-                    edu_details.runs[0].font.size = Pt(10)
-                    edu_details.runs[0].font.name = 'Calibri'
-                doc.add_paragraph()  # Spacing
+        succeeded = sum(1 for item in results if item['filename'])
+        return {
+            'job_id': job_id,
+            'total': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'seconds': round(time.perf_counter() - started, 4),
+            'items': results
+        }
+    
+    def _get_batch_pool(self):
+        with self._batch_pool_lock:
+            if ResumeGenerator._batch_pool is None:
+                workers = Config.BATCH_MAX_WORKERS or os.cpu_count() or 1
+                print(f"[DEBUG] Starting batch render pool with {workers} workers")
+                ResumeGenerator._batch_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(BATCH_START_METHOD),
+                    initializer=_init_batch_worker
+                )
+            return ResumeGenerator._batch_pool
+    
+    def _get_render_pool(self):
+        with self._batch_pool_lock:
+            if ResumeGenerator._render_pool is None:
+                ResumeGenerator._render_pool = ThreadPoolExecutor(
+                    max_workers=Config.RENDER_POOL_THREADS, thread_name_prefix='render'
+                )
+            return ResumeGenerator._render_pool
+    
+    def file_digest(self, filename):
+        """sha256 of a stored file's bytes, for strong download ETags. Renders are
+        not byte-for-byte repeatable, so it is the hash recorded when this very
+        file was written, or else the file is hashed again."""
+        signature = file_signature(os.stat(self.storage.path_for(filename)))
+        recorded = self.index.digest(filename) if self.index is not None else None
+        if recorded is not None and recorded[1] == signature:
+            return recorded[0]
+        sha256, signature = self.storage.digest(filename)
+        if self.index is not None:
+            self.index.set_digest(filename, sha256, signature)
+        return sha256
+    
+    def fit_report(self, fit_pages, filename=None, data=None):
+        """How a PDF rendered with fit_pages came out: its page count and whether
+        it still runs over the budget, which happens when it does not fit even
+        at the smallest scale. Pass the stored filename or the rendered bytes."""
+        if data is None:
+            with open(self.storage.path_for(filename), 'rb') as f:
+                data = f.read()
+        pages = get_backend('pdf').page_count(data)
+        return {'pages': pages, 'fit_pages': fit_pages, 'fit_exceeded': pages > fit_pages}
+    
+    def _record_file(self, filename, size, owner, template, format, key, digest=(None, None)):
+        """Register a stored file for retention and listing; digest is what
+        storage.write() returned if the file was just written"""
+        self.render_cache.put_file(filename, size, owner)
+        if self.index is not None:
+            self.index.add(filename, size, time.time(), owner, template, format, key, *digest)
+    
+    def _validate_request(self, template, format, docx_writer='python-docx'):
+        if docx_writer not in DOCX_WRITERS:
+            raise ValueError(f"Unknown DOCX writer: {docx_writer}")
+        if format not in MIME_TYPES:
+            raise ValueError(f"Unsupported format: {format}")
+        if template not in self.templates:
+            print(f"[ERROR] Unknown template: {template}")
+            raise ValueError(f"Unknown template: {template}")
+    
+    def _render_options(self, format, fit_pages):
+        """Backend options that change the output, and so belong in the cache key"""
+        if fit_pages and format == 'pdf':
+            return {'fit_pages': int(fit_pages)}
+        return {}
+    
+    def _get_rendered(self, profile_data, template, format, key, docx_writer='python-docx', layout=None, options=None):
+        """Return rendered bytes from the memory tier, the disk tier or a fresh render.
+        Both DOCX writers produce equivalent documents, so they share cache entries."""
+        data = self.render_cache.get_memory(key)
+        if data is not None:
+            print(f"[DEBUG] Render cache hit (memory): {key[:16]}")
+            return data
         
-        # Skills
-        skills = profile_data.get('skills', [])
-        if skills:
-            self._add_section_header(doc, "TECHNICAL SKILLS")
-            skills_text = ", ".join(skills)
-            skills_para = doc.add_paragraph(skills_text)
-            if skills_para.runs:
-                skills_para.runs[0].font.size = Pt(11)
-                skills_para.runs[0].font.name = 'Calibri'
-            doc.add_paragraph()  # Spacing
+        filename = self.render_cache.filename_for(key, template, format)
+        if self.render_cache.has_file(filename):
+            with open(self.storage.path_for(filename), 'rb') as f:
+                data = f.read()
+        else:
+            buffer = BytesIO()
+            self._render_to(profile_data, template, format, buffer, docx_writer, layout, options)
+            data = buffer.getvalue()
+            if not data:
+                raise ValueError(f"Resume rendered no content: {filename}")
         
-        # Save document
-        print(f"[DEBUG] Saving resume to: {filepath}")
-        try:
-            doc.save(filepath)
-            print(f"[DEBUG] Resume saved successfully: {filepath}")
-        except Exception as e:
-            print(f"[ERROR] Failed to save resume: {e}")
+        self.render_cache.put_memory(key, data)
+        return data
     
-    def _add_section_header(self, doc, title):
-        """Add section header for modern template"""
-        header = doc.add_paragraph()
-        header_run = header.add_run(title)
-        header_run.font.bold = True
-        header_run.font.size = Pt(14)
-        header_run.font.name = 'Calibri'
-        header_run.font.underline = True
-        
-        doc.add_paragraph()  # Spacing 
+    def _render_to(self, profile_data, template, format, target, docx_writer='python-docx', layout=None, options=None):
+        """Render resume into a file path or a writable buffer"""
+        if layout is None:
+            layout = build_layout(profile_data)
+        get_backend(format).render(layout, template, target, docx_writer=docx_writer, **(options or {}))
 
-    def _generate_classic_resume(self, profile_data, filepath):
-        # Placeholder: use modern resume for now
-        self._generate_modern_resume(profile_data, filepath)
+# Warmed-up generator owned by each batch pool process
+_batch_generator = None
 
-    def _generate_minimal_resume(self, profile_data, filepath):
-        # Placeholder: use modern resume for now
-        self._generate_modern_resume(profile_data, filepath) 
+def _init_batch_worker():
+    global _batch_generator
+    # Retention stays with the parent process, which registers the files afterwards
+    _batch_generator = ResumeGenerator(retention=False)
 
-    def _generate_pdf_resume(self, profile_data, filepath, template):
-        """Generate PDF resume"""
-        try:
-            doc = SimpleDocTemplate(filepath, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Create custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=12,
-                alignment=TA_CENTER,
-                textColor=colors.darkblue
-            )
-            
-            subtitle_style = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                textColor=colors.grey
-            )
-            
-            section_style = ParagraphStyle(
-                'SectionHeader',
-                parent=styles['Heading2'],
-                fontSize=16,
-                spaceAfter=6,
-                textColor=colors.darkblue
-            )
-            
-            # Header
-            name = profile_data.get('personal_info', {}).get('name') or profile_data.get('name', '')
-            headline = profile_data.get('personal_info', {}).get('headline') or profile_data.get('headline', '')
-            email = profile_data.get('personal_info', {}).get('email') or profile_data.get('email', '')
-            phone = profile_data.get('personal_info', {}).get('phone') or profile_data.get('phone', '')
-            location = profile_data.get('personal_info', {}).get('location') or profile_data.get('location', '')
-            
-            story.append(Paragraph(name, title_style))
-            if headline:
-                story.append(Paragraph(headline, subtitle_style))
-            
-            # Contact info
-            contact_info = f"{email} | {phone} | {location}"
-            story.append(Paragraph(contact_info, subtitle_style))
-            story.append(Spacer(1, 12))
-            
-            # Summary
-            summary = profile_data.get('personal_info', {}).get('summary') or profile_data.get('summary', '')
-            if summary:
-                story.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
-                story.append(Paragraph(summary, styles['Normal']))
-                story.append(Spacer(1, 12))
-            
-            # Work Experience
-            experience = profile_data.get('experience', [])
-            if experience:
-                story.append(Paragraph("WORK EXPERIENCE", section_style))
-                for exp in experience:
-                    title = exp.get('title', '')
-                    company = exp.get('company', '')
-                    duration = exp.get('duration', '')
-                    description = exp.get('description', '')
-                    
-                    exp_header = f"<b>{title}</b> - {company} ({duration})"
-                    story.append(Paragraph(exp_header, styles['Normal']))
-                    if description:
-                        story.append(Paragraph(description, styles['Normal']))
-                    story.append(Spacer(1, 6))
-                story.append(Spacer(1, 12))
-            
-            # Education
-            education = profile_data.get('education', [])
-            if education:
-                story.append(Paragraph("EDUCATION", section_style))
-                for edu in education:
-                    degree = edu.get('degree', '')
-                    institution = edu.get('institution', '')
-                    year = edu.get('year', '')
-                    
-                    edu_text = f"<b>{degree}</b> - {institution} ({year})"
-                    story.append(Paragraph(edu_text, styles['Normal']))
-                    story.append(Spacer(1, 6))
-                story.append(Spacer(1, 12))
-            
-            # Skills
-            skills = profile_data.get('skills', [])
-            if skills:
-                story.append(Paragraph("SKILLS", section_style))
-                skills_text = ", ".join(skills)
-                story.append(Paragraph(skills_text, styles['Normal']))
-                story.append(Spacer(1, 12))
-            
-            # Build PDF
-            doc.build(story)
-            print(f"[DEBUG] PDF generated successfully: {filepath}")
-            
-        except Exception as e:
-            print(f"[ERROR] Failed to generate PDF: {e}")
-            print(f"[ERROR] PDF Traceback: {traceback.format_exc()}")
-            raise 
\ No newline at end of file
+def _render_batch_item(index, profile_index, profile_data, template, format):
+    """Render one batch item inside a pool process"""
+    started = time.perf_counter()
+    item = {
+        'index': index,
+        'profile_index': profile_index,
+        'template': template,
+        'format': format,
+        'filename': None,
+        'error': None
+    }
+    try:
+        item['filename'] = _batch_generator.generate_resume(profile_data, template, format)
+    except Exception as e:
+        item['error'] = str(e)
+    item['seconds'] = round(time.perf_counter() - started, 4)
+    return item
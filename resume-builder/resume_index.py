@@ -0,0 +1,177 @@
+import os
+import re
+import sqlite3
+import threading
+
+# resume_<template>_<anything>.<format>, for backfilling files written before the index
+RESUME_FILENAME = re.compile(r'^resume_([a-z]+)_.+\.([a-z]+)$')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename TEXT NOT NULL UNIQUE,
+    owner TEXT,
+    template TEXT,
+    format TEXT,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    content_hash TEXT,
+    sha256 TEXT,
+    signature TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_resumes_owner ON resumes (owner, id);
+CREATE INDEX IF NOT EXISTS idx_resumes_template_format ON resumes (template, format, id);
+CREATE TABLE IF NOT EXISTS resume_owners (
+    filename TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    PRIMARY KEY (filename, owner)
+);
+CREATE INDEX IF NOT EXISTS idx_resume_owners_owner ON resume_owners (owner, filename);
+'''
+
+class ResumeIndex:
+    """SQLite index of generated resumes, written by ResumeGenerator when it stores
+    a file and by the storage manager when it evicts one. Listing is a keyset
+    query on the autoincrement id, newest first, so every page costs the same
+    however many files exist.
+
+    A content-addressed file can be handed to several owners. The owner column
+    keeps the first one; resume_owners has all of them."""
+
+    def __init__(self, path):
+        self.path = path
+        is_new = not os.path.exists(path)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            has_owners = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resume_owners'"
+            ).fetchone()
+            self._connection.executescript(SCHEMA)
+            columns = {row['name'] for row in self._connection.execute('PRAGMA table_info(resumes)')}
+            for column in ('sha256', 'signature'):
+                if column not in columns:
+                    # Indexes written before downloads were tagged by their bytes
+                    self._connection.execute(f'ALTER TABLE resumes ADD COLUMN {column} TEXT')
+            if not has_owners:
+                # Indexes written before files could have several owners
+                self._connection.execute(
+                    'INSERT OR IGNORE INTO resume_owners (filename, owner) '
+                    'SELECT filename, owner FROM resumes WHERE owner IS NOT NULL'
+                )
+        self.is_new = is_new
+
+    def add(self, filename, size, created, owner=None, template=None, format=None, content_hash=None,
+            sha256=None, signature=None):
+        """Record a stored file; a file that is already indexed keeps its row
+        and gains owner as another owner. sha256 and signature describe the
+        bytes just written, if this call follows a write."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT INTO resumes (filename, owner, template, format, size, created, content_hash, sha256, signature) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (filename) DO UPDATE SET sha256 = COALESCE(excluded.sha256, sha256), '
+                'signature = COALESCE(excluded.signature, signature), size = excluded.size',
+                (filename, owner, template, format, size, created, content_hash, sha256, signature)
+            )
+            if owner is not None:
+                self._connection.execute(
+                    'INSERT OR IGNORE INTO resume_owners (filename, owner) VALUES (?, ?)', (filename, owner)
+                )
+
+    def remove(self, filename):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM resumes WHERE filename = ?', (filename,))
+            self._connection.execute('DELETE FROM resume_owners WHERE filename = ?', (filename,))
+
+    def digest(self, filename):
+        """(sha256, signature) recorded for a file, or None"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT sha256, signature FROM resumes WHERE filename = ?', (filename,)
+            ).fetchone()
+        return (row['sha256'], row['signature']) if row and row['sha256'] else None
+
+    def set_digest(self, filename, sha256, signature):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'UPDATE resumes SET sha256 = ?, signature = ? WHERE filename = ?', (sha256, signature, filename)
+            )
+
+    def release(self, filename, owner):
+        """Drop one owner of a file that stays stored for the others"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM resume_owners WHERE filename = ? AND owner = ?', (filename, owner)
+            )
+
+    def owners(self):
+        """Map of filename to the set of its owners, for every file that has one"""
+        owners = {}
+        with self._lock:
+            for row in self._connection.execute('SELECT filename, owner FROM resume_owners'):
+                owners.setdefault(row['filename'], set()).add(row['owner'])
+        return owners
+
+    def backfill(self, storage):
+        """Index files that were written before the index existed"""
+        rows = []
+        for filename, entry in storage.iter_files():
+            match = RESUME_FILENAME.match(filename)
+            if match:
+                stat = entry.stat()
+                rows.append((filename, match.group(1), match.group(2), stat.st_size, stat.st_mtime))
+        # Oldest first, so ids follow creation order
+        rows.sort(key=lambda row: row[4])
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO resumes (filename, template, format, size, created) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+        return len(rows)
+
+    def list(self, limit=50, cursor=None, owner=None, template=None, format=None,
+             created_after=None, created_before=None, viewer=None):
+        """Return (rows, next_cursor). Rows are newest first; pass next_cursor back
+        to get the following page, None means there are no more rows. owner
+        limits the rows to files that owner holds; with a viewer, each row's
+        mine tells whether the viewer holds it."""
+        clauses = []
+        params = []
+        if cursor is not None:
+            clauses.append('id < ?')
+            params.append(int(cursor))
+        if owner is not None:
+            clauses.append('filename IN (SELECT filename FROM resume_owners WHERE owner = ?)')
+            params.append(owner)
+        for column, value in (('template', template), ('format', format)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if created_after is not None:
+            clauses.append('created >= ?')
+            params.append(created_after)
+        if created_before is not None:
+            clauses.append('created < ?')
+            params.append(created_before)
+
+        query = (
+            'SELECT *, EXISTS (SELECT 1 FROM resume_owners o WHERE o.filename = resumes.filename AND o.owner = ?) '
+            'AS mine FROM resumes'
+        )
+        params.insert(0, viewer)
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY id DESC LIMIT ?'
+        # One extra row tells whether another page exists
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = [dict(row) for row in self._connection.execute(query, params)]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = str(rows[-1]['id'])
+        return rows, next_cursor
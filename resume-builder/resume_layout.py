@@ -0,0 +1,92 @@
+from collections import namedtuple
+from render_cache import normalize_profile
+
+# Intermediate layout shared by every output format. A profile is normalized and
+# laid out once; backends only decide how each node looks. Nodes are tuples, so
+# a layout is immutable and safe to hand to several renderers at once.
+ResumeLayout = namedtuple('ResumeLayout', 'name headline contact sections')
+
+# kind is 'text' (paragraphs), 'entries' or 'list' (items joined on one line)
+Section = namedtuple('Section', 'key title kind content')
+
+# One position or degree: title and organization, then dates, location and
+# extra details such as a GPA, then an optional description (positions only)
+Entry = namedtuple('Entry', 'title organization dates location details description')
+
+def _text(value):
+    return '' if value is None else str(value)
+
+def _first(item, *keys):
+    """Value of the first key that is set; parsers disagree on field names"""
+    for key in keys:
+        if item.get(key):
+            return _text(item[key])
+    return ''
+
+def _certification(cert):
+    """"Name - Issuer (Date)", leaving out the parts that are not set"""
+    if not isinstance(cert, dict):
+        return _text(cert)
+    text = ' - '.join(value for value in (_first(cert, 'name', 'title'), _first(cert, 'issuer', 'organization')) if value)
+    date = _first(cert, 'date', 'year')
+    return f'{text} ({date})' if date else text
+
+def build_layout(profile_data):
+    """Lay out a flat or LinkedIn-style (personal_info) profile"""
+    profile = normalize_profile(profile_data)
+    sections = []
+
+    summary = _text(profile.get('summary'))
+    if summary:
+        sections.append(Section('summary', 'PROFESSIONAL SUMMARY', 'text', (summary,)))
+
+    experience = profile.get('experience') or []
+    if experience:
+        sections.append(Section('experience', 'PROFESSIONAL EXPERIENCE', 'entries', tuple(
+            Entry(
+                _first(exp, 'title', 'position'),
+                _first(exp, 'company', 'organization'),
+                _first(exp, 'duration', 'dates', 'year'),
+                _first(exp, 'location'),
+                (),
+                _first(exp, 'description')
+            )
+            for exp in experience
+        )))
+
+    education = profile.get('education') or []
+    if education:
+        sections.append(Section('education', 'EDUCATION', 'entries', tuple(
+            Entry(
+                _first(edu, 'degree'),
+                _first(edu, 'school', 'institution'),
+                _first(edu, 'duration', 'year', 'dates'),
+                _first(edu, 'location'),
+                (f"GPA: {edu['gpa']}",) if edu.get('gpa') else (),
+                ''
+            )
+            for edu in education
+        )))
+
+    skills = profile.get('skills') or []
+    if skills:
+        sections.append(Section('skills', 'TECHNICAL SKILLS', 'list', tuple(_text(skill) for skill in skills)))
+
+    certifications = profile.get('certifications') or []
+    if certifications:
+        sections.append(Section('certifications', 'CERTIFICATIONS', 'text', tuple(
+            _certification(cert) for cert in certifications
+        )))
+
+    achievements = profile.get('achievements') or []
+    if achievements:
+        sections.append(Section('achievements', 'ACHIEVEMENTS', 'text', tuple(
+            _text(achievement) for achievement in achievements
+        )))
+
+    return ResumeLayout(
+        _text(profile.get('name')),
+        _text(profile.get('headline')),
+        (_text(profile.get('email')), _text(profile.get('phone')), _text(profile.get('location'))),
+        tuple(sections)
+    )
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+# Content-addressed names: resume_<template>_<16 hex digits of the cache key>.<format>
+HASHED_FILENAME = re.compile(r'^resume_[a-z]+_([0-9a-f]{16})\.[a-z]+$')
+
+# Prefix of in-progress writes, which are never listed or served
+TEMP_PREFIX = '.tmp-'
+
+# Hex digits of the hash used as the shard directory name (256 shards)
+SHARD_WIDTH = 2
+
+def file_signature(stat):
+    """Tells one write of a file from another: every write is a new inode, renamed into place"""
+    return f'{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}'
+
+class ResumeStorage:
+    """Sharded, atomically written layout of generated resumes.
+
+    resume_<template>_<hash>.<format> lives in <directory>/<first hash digits>/,
+    so no single directory grows without bound. Files are written under a
+    unique temporary name in the target shard and renamed into place, so
+    concurrent writers never overwrite each other's partial output and readers
+    only ever see complete files. Other names (e.g. older timestamped files)
+    are looked up in the top-level directory."""
+
+    def __init__(self, directory):
+        # Absolute, since Flask's send_file resolves relative paths against the app root
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._move_flat_files_to_shards()
+
+    def path_for(self, filename):
+        """Path a resume file is stored at"""
+        match = HASHED_FILENAME.match(filename)
+        if match:
+            return os.path.join(self.directory, match.group(1)[:SHARD_WIDTH], filename)
+        return os.path.join(self.directory, filename)
+
+    def content_hash(self, filename):
+        """Hash digits in a content-addressed filename, or None for other names"""
+        match = HASHED_FILENAME.match(filename)
+        return match.group(1) if match else None
+
+    def resolve(self, filename):
+        """Path of an existing resume file, or None. Rejects anything but a bare filename."""
+        if not filename or filename != os.path.basename(filename) or filename.startswith(TEMP_PREFIX):
+            return None
+        path = self.path_for(filename)
+        return path if os.path.isfile(path) else None
+
+    def write(self, filename, data):
+        """Write a resume file atomically. Returns (sha256, signature): the hash
+        of the bytes written and the file_signature() of this write."""
+        path = self.path_for(filename)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=shard, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                signature = file_signature(os.fstat(f.fileno()))
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        return hashlib.sha256(data).hexdigest(), signature
+
+    def digest(self, filename):
+        """(sha256, signature) of a stored file as it is on disk now"""
+        sha256 = hashlib.sha256()
+        with open(self.path_for(filename), 'rb') as f:
+            signature = file_signature(os.fstat(f.fileno()))
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest(), signature
+
+    def iter_files(self):
+        """Yield (filename, os.DirEntry) for every stored resume"""
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(TEMP_PREFIX):
+                continue
+            if entry.is_file():
+                yield entry.name, entry
+            elif entry.is_dir() and len(entry.name) == SHARD_WIDTH:
+                for shard_entry in os.scandir(entry.path):
+                    if shard_entry.is_file() and not shard_entry.name.startswith(TEMP_PREFIX):
+                        yield shard_entry.name, shard_entry
+
+    def remove_stale_temp_files(self, older_than=3600):
+        """Delete temporary files left behind by writers that crashed mid-write"""
+        cutoff = time.time() - older_than
+        for shard in [self.directory] + [entry.path for entry in os.scandir(self.directory) if entry.is_dir()]:
+            for entry in os.scandir(shard):
+                if entry.name.startswith(TEMP_PREFIX) and entry.is_file() and entry.stat().st_mtime < cutoff:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def _move_flat_files_to_shards(self):
+        """Move content-addressed files written before sharding into their shard"""
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and HASHED_FILENAME.match(entry.name):
+                path = self.path_for(entry.name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(entry.path, path)
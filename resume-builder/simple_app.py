@@ -10,6 +10,8 @@ from datetime import datetime
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import urllib.parse
 import cgi
+from resume_layout import build_layout
+from text_backend import TextBackend
 
 class ResumeBuilderHandler(SimpleHTTPRequestHandler):
     def do_GET(self):
@@ -139,59 +141,7 @@ class ResumeBuilderHandler(SimpleHTTPRequestHandler):
     
     def generate_text_resume(self, profile_data, template):
         """Generate a simple text-based resume"""
-        resume = []
-        
-        # Header
-        if profile_data.get('personal_info'):
-            info = profile_data['personal_info']
-            resume.append(f"{'='*50}")
-            resume.append(f"{info.get('name', 'N/A').upper()}")
-            resume.append(f"{info.get('headline', 'N/A')}")
-            resume.append(f"{'='*50}")
-            resume.append("")
-            
-            # Contact info
-            resume.append("CONTACT INFORMATION")
-            resume.append(f"Email: {info.get('email', 'N/A')}")
-            resume.append(f"Phone: {info.get('phone', 'N/A')}")
-            resume.append(f"Location: {info.get('location', 'N/A')}")
-            resume.append("")
-            
-            # Summary
-            if info.get('summary'):
-                resume.append("PROFESSIONAL SUMMARY")
-                resume.append(info['summary'])
-                resume.append("")
-        
-        # Experience
-        if profile_data.get('experience'):
-            resume.append("PROFESSIONAL EXPERIENCE")
-            resume.append("-" * 30)
-            for exp in profile_data['experience']:
-                resume.append(f"{exp.get('title', 'N/A')} - {exp.get('company', 'N/A')}")
-                resume.append(f"{exp.get('duration', 'N/A')} | {exp.get('location', 'N/A')}")
-                resume.append(f"{exp.get('description', 'N/A')}")
-                resume.append("")
-        
-        # Education
-        if profile_data.get('education'):
-            resume.append("EDUCATION")
-            resume.append("-" * 30)
-            for edu in profile_data['education']:
-                resume.append(f"{edu.get('degree', 'N/A')}")
-                resume.append(f"{edu.get('school', 'N/A')} | {edu.get('duration', 'N/A')}")
-                if edu.get('gpa'):
-                    resume.append(f"GPA: {edu['gpa']}")
-                resume.append("")
-        
-        # Skills
-        if profile_data.get('skills'):
-            resume.append("TECHNICAL SKILLS")
-            resume.append("-" * 30)
-            resume.append(", ".join(profile_data['skills']))
-            resume.append("")
-        
-        return "\n".join(resume)
+        return ''.join(TextBackend().iter_chunks(build_layout(profile_data), template))
 
 def run_server(port=8000):
     """Run the simple HTTP server"""
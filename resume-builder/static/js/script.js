@@ -579,7 +579,9 @@ class ResumeBuilder {
                 body: JSON.stringify({
                     profile_data: formData,
                     template: template,
-                    format: format
+                    format: format,
+                    // Direct OOXML writer reuses unchanged sections between edits
+                    docx_writer: 'fast'
                 })
             });
             const data = await response.json();
@@ -853,22 +855,60 @@ class ResumeBuilder {
         const inputs = document.querySelectorAll('#manualResumeForm input, #manualResumeForm textarea');
         inputs.forEach(input => {
             input.addEventListener('input', () => {
-                this.updateManualPreview();
+                this.scheduleManualPreview();
             });
         });
     }
 
+    // Refresh the preview once typing pauses rather than on every keystroke
+    scheduleManualPreview() {
+        clearTimeout(this.previewTimer);
+        this.previewTimer = setTimeout(() => {
+            this.updateManualPreview();
+        }, 150);
+    }
+
     // Update manual preview
-    updateManualPreview() {
+    async updateManualPreview() {
+        clearTimeout(this.previewTimer);
         const formData = this.collectManualFormData();
         const preview = document.getElementById('livePreview');
         
         if (!formData.personal_info.name) {
+            this.previewHash = null;
             preview.innerHTML = '<div class="text-center text-muted mt-5"><i class="fas fa-file-alt fa-3x mb-3"></i><p>Start entering your information to see the live preview</p></div>';
             return;
         }
         
-        preview.innerHTML = this.generatePreviewHTML(formData);
+        // Rendered by the server from the same layout as the download; the
+        // hash lets it skip sending a preview that has not changed
+        const request = this.previewRequest = (this.previewRequest || 0) + 1;
+        try {
+            const response = await fetch('/preview-resume', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    profile_data: formData,
+                    format: 'html',
+                    hash: this.previewHash
+                })
+            });
+            const data = await response.json();
+            // Ignore responses overtaken by a later keystroke
+            if (request !== this.previewRequest || !data.success) {
+                return;
+            }
+            if (!data.unchanged) {
+                this.previewHash = data.hash;
+                preview.innerHTML = data.content;
+            }
+        } catch (error) {
+            console.error('Error updating preview:', error);
+            this.previewHash = null;
+            preview.innerHTML = this.generatePreviewHTML(formData);
+        }
     }
 
     // Generate preview HTML
@@ -1169,28 +1209,53 @@ document.addEventListener('DOMContentLoaded', () => {
     new ResumeBuilder();
     const jobSearchForm = document.getElementById('jobSearchForm');
     if (jobSearchForm) {
-        jobSearchForm.addEventListener('submit', async (e) => {
-            e.preventDefault();
-            const skills = document.getElementById('jobSkills').value;
-            const experience = document.getElementById('jobExperience').value;
-            const location = document.getElementById('jobLocation').value;
-            const jobType = document.getElementById('jobType').value;
+        let lastSearch = null;
+        const searchJobs = async (cursor) => {
             const res = await fetch('/job-search', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ skills, experience, location, jobType })
+                body: JSON.stringify({ ...lastSearch, cursor })
             });
             const data = await res.json();
-            renderJobSearchResults(data.jobs || []);
+            renderJobSearchResults(data.jobs || [], Boolean(cursor));
+            renderJobSearchMore(data.next_cursor, searchJobs);
+        };
+        jobSearchForm.addEventListener('submit', async (e) => {
+            e.preventDefault();
+            lastSearch = {
+                skills: document.getElementById('jobSkills').value,
+                experience: document.getElementById('jobExperience').value,
+                location: document.getElementById('jobLocation').value,
+                jobType: document.getElementById('jobType').value
+            };
+            await searchJobs(null);
         });
     }
 });
 
-function renderJobSearchResults(jobs) {
+function renderJobSearchMore(nextCursor, searchJobs) {
+    const resultsDiv = document.getElementById('jobSearchResults');
+    if (!resultsDiv) return;
+    let moreDiv = document.getElementById('jobSearchMore');
+    if (!moreDiv) {
+        moreDiv = document.createElement('div');
+        moreDiv.id = 'jobSearchMore';
+        moreDiv.className = 'text-center mb-4';
+        resultsDiv.after(moreDiv);
+    }
+    moreDiv.innerHTML = nextCursor ? '<button type="button" class="btn btn-outline-info">Load more jobs</button>' : '';
+    if (nextCursor) {
+        moreDiv.querySelector('button').addEventListener('click', () => searchJobs(nextCursor));
+    }
+}
+
+function renderJobSearchResults(jobs, append = false) {
     const resultsDiv = document.getElementById('jobSearchResults');
     if (!resultsDiv) return;
     if (!jobs.length) {
-        resultsDiv.innerHTML = '<div class="alert alert-warning">No jobs found for your criteria.</div>';
+        if (!append) {
+            resultsDiv.innerHTML = '<div class="alert alert-warning">No jobs found for your criteria.</div>';
+        }
         return;
     }
     let html = '';
@@ -1214,7 +1279,11 @@ function renderJobSearchResults(jobs) {
             </div>
         </div>`;
     });
-    resultsDiv.innerHTML = html;
+    if (append) {
+        resultsDiv.insertAdjacentHTML('beforeend', html);
+    } else {
+        resultsDiv.innerHTML = html;
+    }
 }
 
 // Add some additional utility functions
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+class StorageManager:
+    """Retention, quotas and eviction for generated resumes.
+
+    Keeps an in-memory index of every stored file ordered by last access, plus
+    the same order per owner. The directory is scanned once at startup. After
+    that, eviction only walks the head of the index and stops at the first
+    file that may be kept:
+    - files not accessed for max_age seconds are removed by a background thread
+    - the least recently accessed files go once the store exceeds max_bytes
+    - an owner's least recently accessed files go once they exceed user_quota_bytes
+    A limit of 0 or None disables that rule. Files are content-addressed, so
+    one file can be handed to several owners; each of them is charged for it,
+    and an owner over quota gives up their share of a file before it is
+    removed from disk. owners maps filenames to the set of owners recorded
+    when they were written, so quotas survive a restart."""
+
+    def __init__(self, storage, max_age=None, max_bytes=None, user_quota_bytes=None, interval=300, owners=None):
+        self.storage = storage
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.user_quota_bytes = user_quota_bytes
+        self.interval = interval
+
+        # filename -> [size, owners, last access], least recently accessed first
+        self._entries = OrderedDict()
+        self._owner_entries = {}
+        self._owner_bytes = {}
+        self.total_bytes = 0
+        self._removal_listeners = []
+        self._release_listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._load_index(owners or {})
+
+    def contains(self, filename):
+        """Check a file is stored and mark it as accessed"""
+        with self._lock:
+            if filename not in self._entries:
+                return False
+            if not os.path.exists(self.storage.path_for(filename)):
+                # Deleted behind our back; the listeners still need to hear of it
+                self._remove(filename, 'missing', delete=False)
+                return False
+            self._touch(filename)
+            return True
+
+    def touch(self, filename):
+        """Mark a file as accessed, e.g. when it is downloaded"""
+        with self._lock:
+            if filename in self._entries:
+                self._touch(filename)
+
+    def add(self, filename, size, owner=None):
+        """Register a file written or handed out for owner, then enforce the
+        owner quota and the total size limit. The file itself is never evicted
+        here."""
+        with self._lock:
+            if filename in self._entries:
+                self._touch(filename)
+            else:
+                self._entries[filename] = [size, set(), time.time()]
+                self.total_bytes += size
+            if owner is not None and owner not in self._entries[filename][1]:
+                self._charge(filename, owner)
+
+            if owner is not None and self.user_quota_bytes:
+                owned = self._owner_entries[owner]
+                while self._owner_bytes[owner] > self.user_quota_bytes and len(owned) > 1:
+                    oldest = next(iter(owned))
+                    if len(self._entries[oldest][1]) > 1:
+                        # Still handed out to someone else, so only this owner lets go
+                        self._release(oldest, owner)
+                        for listener in self._release_listeners:
+                            listener(oldest, owner)
+                    else:
+                        self._remove(oldest, 'quota')
+            self._evict_over_budget(keep=filename)
+
+    def on_remove(self, listener):
+        """Call listener(filename, reason) whenever a file is evicted, or found
+        to have been deleted from disk (reason 'missing')"""
+        self._removal_listeners.append(listener)
+
+    def on_release(self, listener):
+        """Call listener(filename, owner) whenever an owner over quota gives up a
+        file that stays stored for its other owners"""
+        self._release_listeners.append(listener)
+
+    def run_eviction(self):
+        """Remove expired files and enforce the total size limit, returns the number removed"""
+        removed = 0
+        with self._lock:
+            if self.max_age:
+                cutoff = time.time() - self.max_age
+                while self._entries:
+                    filename, (_, _, accessed) = next(iter(self._entries.items()))
+                    if accessed >= cutoff:
+                        break
+                    self._remove(filename, 'age')
+                    removed += 1
+            removed += self._evict_over_budget()
+        if removed:
+            print(f"[DEBUG] Storage eviction removed {removed} files, {self.total_bytes} bytes in use")
+        return removed
+
+    def start(self):
+        """Run eviction every interval seconds in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='storage-eviction', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'files': len(self._entries),
+                'bytes': self.total_bytes,
+                'owners': dict(self._owner_bytes)
+            }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_eviction()
+            except Exception as e:
+                print(f"[ERROR] Storage eviction failed: {e}")
+
+    def _evict_over_budget(self, keep=None):
+        removed = 0
+        if self.max_bytes:
+            while self.total_bytes > self.max_bytes and self._entries:
+                filename = next(iter(self._entries))
+                if filename == keep:
+                    break
+                self._remove(filename, 'size')
+                removed += 1
+        return removed
+
+    def _touch(self, filename):
+        entry = self._entries[filename]
+        entry[2] = time.time()
+        self._entries.move_to_end(filename)
+        for owner in entry[1]:
+            self._owner_entries[owner].move_to_end(filename)
+
+    def _charge(self, filename, owner):
+        entry = self._entries[filename]
+        entry[1].add(owner)
+        self._owner_entries.setdefault(owner, OrderedDict())[filename] = None
+        self._owner_bytes[owner] = self._owner_bytes.get(owner, 0) + entry[0]
+
+    def _release(self, filename, owner):
+        entry = self._entries[filename]
+        entry[1].discard(owner)
+        del self._owner_entries[owner][filename]
+        self._owner_bytes[owner] -= entry[0]
+        if not self._owner_entries[owner]:
+            del self._owner_entries[owner]
+            del self._owner_bytes[owner]
+
+    def _forget(self, filename):
+        for owner in list(self._entries[filename][1]):
+            self._release(filename, owner)
+        size, _, _ = self._entries.pop(filename)
+        self.total_bytes -= size
+
+    def _remove(self, filename, reason, delete=True):
+        self._forget(filename)
+        if delete:
+            try:
+                os.remove(self.storage.path_for(filename))
+            except OSError:
+                pass
+        for listener in self._removal_listeners:
+            listener(filename, reason)
+
+    def _load_index(self, owners):
+        """Index the files already on disk, ordered by their last access or modification"""
+        entries = []
+        for filename, entry in self.storage.iter_files():
+            stat = entry.stat()
+            entries.append((max(stat.st_atime, stat.st_mtime), filename, stat.st_size))
+        for accessed, filename, size in sorted(entries):
+            self._entries[filename] = [size, set(), accessed]
+            self.total_bytes += size
+            for owner in owners.get(filename, ()):
+                self._charge(filename, owner)
@@ -0,0 +1,186 @@
+import json
+import re
+from abc import ABC, abstractmethod
+
+# Lightweight output formats. These backends only build strings from the layout,
+# so a render takes microseconds and imports nothing heavier than json.
+
+# Characters Markdown would otherwise read as formatting, anywhere or at the
+# start of a line
+MARKDOWN_SPECIAL = re.compile(r'([\\`*_\[\]<>])|^(?=[#+-])|^(\d+)(?=\.)', re.MULTILINE)
+
+MONTHS = {
+    month: index + 1 for index, month in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+    )
+}
+
+# "2019", "2019-03", "Mar 2019" or "March 2019"
+DATE = re.compile(r'^(?:(\d{4})(?:-(\d{2}))?|([A-Za-z]{3})[a-z]*\.? (\d{4}))$')
+
+class ChunkedBackend(ABC):
+    """Base for backends that produce a resume as a stream of text chunks.
+    render() writes each chunk as it is produced, so the whole document is
+    never held as one string."""
+
+    def render(self, layout, template, target, **options):
+        """Write the resume to a file path or a writable buffer"""
+        if isinstance(target, str):
+            with open(target, 'wb') as f:
+                self._write(layout, template, f)
+        else:
+            self._write(layout, template, target)
+
+    def _write(self, layout, template, stream):
+        for chunk in self.iter_chunks(layout, template):
+            stream.write(chunk.encode('utf-8'))
+
+    @abstractmethod
+    def iter_chunks(self, layout, template=None):
+        """Yield the resume as str chunks"""
+
+def meta_line(entry):
+    """Dates, location and details of an entry, skipping empty values"""
+    return ' | '.join(value for value in (entry.dates, entry.location) + entry.details if value)
+
+class TextBackend(ChunkedBackend):
+    """Plain text in the shape of simple_app's text resume. Suits ATS uploads."""
+
+    def iter_chunks(self, layout, template=None):
+        email, phone, location = layout.contact
+        yield '\n'.join([
+            '=' * 50, layout.name.upper(), layout.headline, '=' * 50, '',
+            'CONTACT INFORMATION', f'Email: {email}', f'Phone: {phone}', f'Location: {location}', ''
+        ]) + '\n'
+
+        for section in layout.sections:
+            yield section.title + '\n'
+            if section.kind == 'entries':
+                yield '-' * 30 + '\n'
+                for entry in section.content:
+                    lines = [f'{entry.title} - {entry.organization}', meta_line(entry)]
+                    if entry.description:
+                        lines.append(entry.description)
+                    yield '\n'.join(lines) + '\n\n'
+            elif section.kind == 'list':
+                yield '-' * 30 + '\n' + ', '.join(section.content) + '\n\n'
+            else:
+                yield '\n'.join(section.content) + '\n\n'
+
+def _escape_markdown(match):
+    special, number = match.groups()
+    if number:
+        # "1." would start a numbered list
+        return number + '\\'
+    return '\\' + (special or '')
+
+def _md(text):
+    return MARKDOWN_SPECIAL.sub(_escape_markdown, text)
+
+class MarkdownBackend(ChunkedBackend):
+    """GitHub-flavoured Markdown: name and sections as headings, one heading
+    per position or degree"""
+
+    def iter_chunks(self, layout, template=None):
+        yield f'# {_md(layout.name)}\n\n'
+        if layout.headline:
+            yield f'**{_md(layout.headline)}**\n\n'
+        contact = ' · '.join(_md(value) for value in layout.contact if value)
+        if contact:
+            yield contact + '\n\n'
+
+        for section in layout.sections:
+            yield f'## {_md(section.title.title())}\n\n'
+            if section.kind == 'entries':
+                for entry in section.content:
+                    heading = ' — '.join(_md(value) for value in (entry.title, entry.organization) if value)
+                    chunk = f'### {heading}\n\n'
+                    meta = meta_line(entry)
+                    if meta:
+                        chunk += f'*{_md(meta)}*\n\n'
+                    if entry.description:
+                        chunk += f'{_md(entry.description)}\n\n'
+                    yield chunk
+            elif section.kind == 'list':
+                yield ', '.join(_md(item) for item in section.content) + '\n\n'
+            else:
+                yield ''.join(f'{_md(text)}\n\n' for text in section.content)
+
+def _iso_date(text):
+    """ISO 8601 date (YYYY or YYYY-MM) for a free-text date, or None"""
+    match = DATE.match(text.strip())
+    if not match:
+        return None
+    year, month, month_name, named_year = match.groups()
+    if named_year:
+        month = MONTHS.get(month_name.lower())
+        return f'{named_year}-{month:02d}' if month else named_year
+    return f'{year}-{month}' if month else year
+
+def _date_range(text):
+    """JSON Resume startDate/endDate for a range such as "Jan 2020 - Present".
+    Dates that are not recognised are left out."""
+    dates = {}
+    parts = re.split(r'\s+[-–—]\s+|\s+to\s+', text, maxsplit=1)
+    if len(parts) == 1:
+        end = _iso_date(parts[0])
+        if end:
+            dates['endDate'] = end
+        return dates
+    start, end = _iso_date(parts[0]), _iso_date(parts[1])
+    if start:
+        dates['startDate'] = start
+    if end:
+        dates['endDate'] = end
+    return dates
+
+class JsonResumeBackend(ChunkedBackend):
+    """JSON Resume (jsonresume.org schema v1). Positions go to work, degrees to
+    education and skills to skills; the document is encoded incrementally."""
+
+    def __init__(self):
+        self.encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def iter_chunks(self, layout, template=None):
+        return self.encoder.iterencode(self.document(layout))
+
+    def document(self, layout):
+        email, phone, location = layout.contact
+        basics = {'name': layout.name}
+        if layout.headline:
+            basics['label'] = layout.headline
+        if email:
+            basics['email'] = email
+        if phone:
+            basics['phone'] = phone
+        if location:
+            basics['location'] = {'address': location}
+
+        document = {'basics': basics}
+        for section in layout.sections:
+            if section.key == 'summary':
+                basics['summary'] = '\n\n'.join(section.content)
+            elif section.key == 'experience':
+                document['work'] = [self._work(entry) for entry in section.content]
+            elif section.key == 'education':
+                document['education'] = [self._education(entry) for entry in section.content]
+            elif section.key == 'skills':
+                document['skills'] = [{'name': skill} for skill in section.content]
+        return document
+
+    def _work(self, entry):
+        work = {'name': entry.organization, 'position': entry.title}
+        if entry.location:
+            work['location'] = entry.location
+        work.update(_date_range(entry.dates))
+        if entry.description:
+            work['summary'] = entry.description
+        return work
+
+    def _education(self, entry):
+        education = {'institution': entry.organization, 'studyType': entry.title}
+        education.update(_date_range(entry.dates))
+        for detail in entry.details:
+            if detail.startswith('GPA: '):
+                education['score'] = detail[len('GPA: '):]
+        return education
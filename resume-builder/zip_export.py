@@ -0,0 +1,60 @@
+import zipfile
+
+# Bytes read from disk per step, and the amount buffered before yielding
+CHUNK_SIZE = 64 * 1024
+
+# Formats that are already zip-compressed and are stored as-is in the archive
+STORED_EXTENSIONS = ('.docx', '.zip')
+
+class _StreamBuffer:
+    """Write-only file object that collects what ZipFile writes until it is drained.
+    It has no seek(), so ZipFile writes data descriptors instead of rewinding."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.pending = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        self.pending += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self.pending = 0
+        return data
+
+def stream_zip(files, chunk_size=CHUNK_SIZE):
+    """Yield a ZIP archive of (filename, path) pairs chunk by chunk. Memory use
+    is bounded by chunk_size no matter how many or how large the files are."""
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for filename, path in files:
+            info = zipfile.ZipInfo.from_file(path, arcname=filename)
+            if filename.lower().endswith(STORED_EXTENSIONS):
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+
+            with open(path, 'rb') as source, archive.open(info, 'w') as target:
+                while True:
+                    chunk = source.read(chunk_size)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    if buffer.pending >= chunk_size:
+                        yield buffer.drain()
+            if buffer.pending:
+                yield buffer.drain()
+
+    # Central directory written when the archive closes
+    yield buffer.drain()